@@ -0,0 +1,30 @@
+"""add composite (symbol, period_end) index to ticker_stats
+
+Revision ID: 3c9f1d2b7e54
+Revises: ef2e673b263d
+Create Date: 2026-10-15 10:12:41.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c9f1d2b7e54'
+down_revision: Union[str, Sequence[str], None] = 'ef2e673b263d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_ticker_symbol_period",
+        "ticker_stats",
+        ["symbol", "period_end"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_ticker_symbol_period", table_name="ticker_stats")
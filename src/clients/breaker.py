@@ -0,0 +1,104 @@
+"""Circuit breaker used to fail fast while the Fiindo API is unavailable.
+
+Without a breaker every symbol processed during an outage burns its full
+retry budget before failing. Once the breaker has seen enough consecutive
+failures it rejects calls immediately until a recovery window has passed,
+then lets a single trial request through to probe whether the API is back.
+"""
+
+import threading
+import time
+from enum import Enum
+from typing import Callable, Optional
+
+
+class CircuitState(str, Enum):
+    """States of a `CircuitBreaker`."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Thread-safe CLOSED -> OPEN -> HALF_OPEN circuit breaker.
+
+    Callers ask `allow_request()` before issuing a call and report the
+    outcome with `record_success()` or `record_failure()`.
+
+    Attributes:
+        failure_threshold: Consecutive failures after which the circuit opens.
+        recovery_time: Seconds the circuit stays open before a trial call.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_time: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Create a closed circuit breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit.
+            recovery_time: Seconds to wait in OPEN state before allowing a
+                single trial request (HALF_OPEN).
+            clock: Monotonic time source in seconds; injectable so tests can
+                move time without patching the `time` module.
+        """
+        self.failure_threshold = failure_threshold
+        self.recovery_time = recovery_time
+        self._clock = clock
+
+        self._lock = threading.Lock()
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+
+    @property
+    def state(self) -> CircuitState:
+        """Return the current circuit state."""
+        with self._lock:
+            return self._state
+
+    def allow_request(self) -> bool:
+        """Return whether a call may be issued right now.
+
+        While OPEN, calls are rejected until `recovery_time` has elapsed;
+        the first call after that is let through as a trial and further
+        calls are rejected until the trial outcome is recorded.
+        """
+        with self._lock:
+            if self._state is CircuitState.CLOSED:
+                return True
+
+            if (
+                self._state is CircuitState.OPEN
+                and self._clock() - self._opened_at >= self.recovery_time
+            ):
+                self._state = CircuitState.HALF_OPEN
+                return True
+
+            return False
+
+    def record_success(self) -> None:
+        """Record a successful call and close the circuit."""
+        with self._lock:
+            self._state = CircuitState.CLOSED
+            self._failures = 0
+            self._opened_at = None
+
+    def record_failure(self) -> None:
+        """Record a failed call, opening the circuit if the threshold is hit.
+
+        A failed trial call in HALF_OPEN state reopens the circuit at once.
+        """
+        with self._lock:
+            self._failures += 1
+
+            if (
+                self._state is CircuitState.HALF_OPEN
+                or self._failures >= self.failure_threshold
+            ):
+                self._state = CircuitState.OPEN
+                self._opened_at = self._clock()
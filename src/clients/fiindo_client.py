@@ -1,28 +1,200 @@
 """HTTP client for communicating with the Fiindo API."""
 
+import functools
 import logging
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from enum import IntEnum
+import orjson
 import requests
-from typing import List, Dict, Any, Optional, Set
+import requests_cache
+from typing import List, Dict, Any, Optional, FrozenSet, Tuple
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+from src.clients.breaker import CircuitBreaker
+from src.clients.rate_limiter import RateLimiter
 from src.core.config import settings
 
 logger = logging.getLogger(__name__)
 
 
+class ErrorCode(IntEnum):
+    """Reason a `FiindoClientError` was raised."""
+
+    UNKNOWN = 0
+    API_ERROR = 1
+    INVALID_JSON = 2
+    INVALID_FORMAT = 3
+    CIRCUIT_OPEN = 4
+
+
 class FiindoClientError(Exception):
-    """Raised when Fiindo API communication fails."""
-    pass
+    """Raised when Fiindo API communication fails.
+
+    Attributes:
+        code: `ErrorCode` classifying the failure, so callers can tell e.g.
+            an open circuit (retry later) from a malformed response
+            without matching on the message.
+        status_code: HTTP status of the failed response, if there was one.
+    """
+
+    def __init__(
+        self,
+        message: str,
+        code: ErrorCode = ErrorCode.UNKNOWN,
+        status_code: Optional[int] = None,
+    ):
+        super().__init__(message)
+        self.code = code
+        self.status_code = status_code
+
+
+class JitterRetry(Retry):
+    """`Retry` strategy using "full jitter" exponential backoff.
+
+    With a deterministic backoff, concurrent ETL workers that are throttled
+    at the same moment all sleep for the same delay and retry in lockstep.
+    Drawing each delay uniformly from `[0, backoff]` spreads them out.
+
+    Connection errors and read timeouts are retried the same way as the
+    listed 5xx statuses; the exponential bound is capped at `backoff_max`.
+    A `Retry-After` sent with a `503` is honoured, but capped at
+    `RETRY_AFTER_MAX`.
+    """
+
+    def get_backoff_time(self) -> float:
+        """Return a random delay between zero and the exponential backoff."""
+        backoff = super().get_backoff_time()
+        if backoff <= 0:
+            return 0
+        return random.uniform(0, backoff)
+
+    def get_retry_after(self, response) -> Optional[float]:
+        """Return the `Retry-After` delay, capped at `RETRY_AFTER_MAX`.
+
+        urllib3 sleeps for the announced value as-is, inside the bulkhead
+        slot, so a bogus `Retry-After: 3600` would stall a worker for an hour
+        per retry.
+        """
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, RETRY_AFTER_MAX)
+
+
+# Upper bound in seconds for a single jittered retry delay.
+RETRY_BACKOFF_MAX = 30
+
+# Upper bound in seconds for honouring a `Retry-After` header.
+RETRY_AFTER_MAX = 30.0
+
+
+class TimeoutHTTPAdapter(HTTPAdapter):
+    """`HTTPAdapter` applying a default timeout to every request it sends.
+
+    Configuring the timeout once on the mounted adapter means no call site
+    can forget it; an explicit per-request `timeout` still takes precedence.
+    """
+
+    def __init__(self, *args, timeout: Optional[float] = None, **kwargs):
+        self.timeout = timeout
+        super().__init__(*args, **kwargs)
+
+    def send(self, request, **kwargs):
+        # `Session.send` always passes `timeout`, defaulting to None.
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = self.timeout
+        return super().send(request, **kwargs)
+
+
+@functools.lru_cache(maxsize=1)
+def _build_session(
+    auth_identifier: str,
+    timeout: float,
+    retries: int,
+    pool_size: int,
+    cache_path: Optional[str],
+) -> requests.Session:
+    """Build the HTTP session shared by all clients with the same settings.
+
+    The session owns the connection pool and its TLS connections, so
+    reusing it across `FiindoClient` instances avoids rebuilding adapters
+    and repeating handshakes in short-lived processes and tests.
+    """
+    if cache_path:
+        session = requests_cache.CachedSession(
+            cache_name=cache_path,
+            backend="sqlite",
+            expire_after=settings.HTTP_CACHE_EXPIRE,
+            # Company profiles (and with them the industry used to filter
+            # symbols) are stable, so keep them much longer than prices.
+            urls_expire_after={
+                "*/api/v1/general/*": settings.HTTP_CACHE_GENERAL_EXPIRE,
+            },
+            cache_control=True,
+            allowable_methods=("GET",),
+        )
+    else:
+        session = requests.Session()
+
+    session.headers.update({
+        "Authorization": f"Bearer {auth_identifier}",
+        "Accept": "application/json",
+    })
+
+    # 429 is not retried here: the API's rate limit spans all workers, so
+    # `FiindoClient` waits out its `Retry-After` once instead of spending
+    # the retry budget. 503s are retried here only, honouring a (capped)
+    # `Retry-After`.
+    retry_strategy = JitterRetry(
+        total=retries,
+        status_forcelist=[500, 502, 503, 504],
+        allowed_methods=["GET"],
+        backoff_factor=0.5,
+        backoff_max=RETRY_BACKOFF_MAX,
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+
+    adapter = TimeoutHTTPAdapter(
+        timeout=timeout,
+        max_retries=retry_strategy,
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        # Wait for a warm keep-alive connection instead of opening a
+        # throwaway one (with a fresh TCP/TLS handshake) during bursts.
+        pool_block=True,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    return session
 
 
 class FiindoClient:
 
-    VALID_STATEMENTS: Set[str] = {
+    # Supported statements in a fixed order; `VALID_STATEMENTS` is the
+    # public set of accepted statements.
+    STATEMENT_ORDER: Tuple[str, ...] = (
         "income_statement",
         "balance_sheet_statement",
         "cash_flow_statement",
-    }
+    )
+    VALID_STATEMENTS: FrozenSet[str] = frozenset(STATEMENT_ORDER)
+
+    # Upper bound in seconds for honouring a `Retry-After` header.
+    RETRY_AFTER_MAX: float = RETRY_AFTER_MAX
+
+    # Upper bound in seconds for the random delay added to `Retry-After`, so
+    # workers throttled together don't all retry at the same instant.
+    RETRY_AFTER_JITTER: float = 0.25
+
+    # Number of error response bytes included in logs and exceptions.
+    ERROR_BODY_MAX: int = 1024
     
     def __init__(
         self,
@@ -30,6 +202,12 @@ class FiindoClient:
         auth_identifier: str = settings.FIINDO_AUTH,
         timeout: int = settings.HTTP_TIMEOUT,
         retries: int = settings.HTTP_RETRIES,
+        max_in_flight: int = settings.ETL_MAX_WORKERS,
+        rate_limit: float = settings.HTTP_RATE_LIMIT,
+        pool_size: int = settings.ETL_MAX_WORKERS,
+        cache_path: Optional[str] = (
+            settings.HTTP_CACHE_PATH if settings.HTTP_CACHE_ENABLED else None
+        ),
     ):
         """Create a `FiindoClient`.
 
@@ -37,66 +215,184 @@ class FiindoClient:
             base_url: Base URL for the Fiindo API (no trailing slash required).
             auth_identifier: Identifier used in the `Authorization` header
                 (format: `{first_name}.{last_name}`).
-            timeout: Per-request timeout in seconds.
+            timeout: Per-request timeout in seconds, applied by the mounted
+                adapter.
             retries: Number of retry attempts for transient HTTP errors.
+            max_in_flight: Maximum number of requests in flight at once
+                across all threads using this client (bulkhead). Bursts
+                beyond it wait instead of piling onto the API and tripping
+                its rate limit.
+            rate_limit: Maximum requests per second across all threads
+                using this client (token bucket), or `0` to disable.
+                Requests above it are delayed client-side instead of
+                being rejected with `429` by the API.
+            pool_size: Number of keep-alive connections kept per host. The
+                default matches `max_in_flight`, so every concurrent request
+                finds a warm connection and none is discarded after use.
+            cache_path: Path of an on-disk SQLite cache for GET responses, or
+                `None` to disable caching. Cached responses are reused for
+                `HTTP_CACHE_EXPIRE` seconds (`HTTP_CACHE_GENERAL_EXPIRE` for
+                general info) unless the API sends `Cache-Control` headers.
         """
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
 
-        self.session = requests.Session()
-        self.session.headers.update({
-            "Authorization": f"Bearer {auth_identifier}",
-            "Accept": "application/json",
-        })
-
-        retry_strategy = Retry(
-            total=retries,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["GET"],
-            backoff_factor=0.5,
-            raise_on_status=False,
+        # Endpoint URLs are built once; getters only substitute the symbol.
+        self._symbols_url = f"{self.base_url}/api/v1/symbols"
+        self._general_url = f"{self.base_url}/api/v1/general/{{symbol}}"
+        self._eod_url = f"{self.base_url}/api/v1/eod/{{symbol}}"
+        # Keyed by statement, so one lookup both validates the statement and
+        # yields its URL template.
+        self._financials_urls = {
+            statement: f"{self.base_url}/api/v1/financials/{{symbol}}/{statement}"
+            for statement in self.STATEMENT_ORDER
+        }
+
+        self.session = _build_session(
+            auth_identifier=auth_identifier,
+            timeout=timeout,
+            retries=retries,
+            pool_size=pool_size,
+            cache_path=cache_path,
         )
 
-        adapter = HTTPAdapter(
-            max_retries=retry_strategy,
-            pool_connections=15, 
-            pool_maxsize=15      
+        self._in_flight = threading.BoundedSemaphore(max_in_flight)
+        self._rate_limiter = RateLimiter(rate_limit) if rate_limit else None
+
+        self._breaker = CircuitBreaker(
+            failure_threshold=settings.HTTP_CIRCUIT_FAILURE_THRESHOLD,
+            recovery_time=settings.HTTP_CIRCUIT_RECOVERY_TIME,
         )
-        self.session.mount("https://", adapter)
-        self.session.mount("http://", adapter)
 
+        # The symbol list doesn't change during a run, so repeated lookups on
+        # this client are served from memory. Failed calls raise and are
+        # therefore never cached. Company profiles are not memoized: the ETL
+        # reads each one once, and the on-disk cache covers re-runs.
+        self.get_symbols = functools.lru_cache(maxsize=1)(self.get_symbols)
+
+    def clear_cache(self) -> None:
+        """Drop all cached responses, e.g. to re-read changed company profiles.
+
+        Clears the in-memory memoization and, when enabled, the on-disk
+        response cache.
+        """
+        self.get_symbols.cache_clear()
+
+        if isinstance(self.session, requests_cache.CachedSession):
+            self.session.cache.clear()
+            logger.info("HTTP response cache cleared")
 
     def _get(self, path: str, params: Optional[dict] = None) -> Any:
-        url = f"{self.base_url}{path}"
-        """Perform a GET request and return parsed JSON."""
+        """Perform a GET request for an API `path` and return parsed JSON."""
+        return self._get_url(f"{self.base_url}{path}", params)
 
-        logger.debug("GET %s | params=%s", url, params)
+    def _get_url(self, url: str, params: Optional[dict] = None) -> Any:
+        """Perform a GET request for a full `url` and return parsed JSON.
 
-        response = self.session.get(
-            url,
-            params=params,
-            timeout=self.timeout,
-        )
+        A `429 Too Many Requests` response is retried once after the delay
+        the API asks for in its `Retry-After` header (plus a little jitter).
+        Other retryable statuses, including `503`, are retried by the
+        session's adapter only.
+        """
+        response = self._send(url, params)
+
+        if response.status_code == 429:
+            delay = self._retry_after(response) + random.uniform(
+                0, self.RETRY_AFTER_JITTER
+            )
+            logger.warning("Rate limited on GET %s, retrying in %.1fs", url, delay)
+            time.sleep(delay)
+            response = self._send(url, params)
 
         if not response.ok:
+            # Decode the (possibly huge HTML) error body once, truncated.
+            body = response.content[:self.ERROR_BODY_MAX].decode(
+                "utf-8", errors="replace"
+            )
             logger.error(
                 "Fiindo API error %s | %s",
                 response.status_code,
-                response.text,
+                body,
             )
             raise FiindoClientError(
-                f"Fiindo API error {response.status_code}: {response.text}"
+                f"Fiindo API error {response.status_code}: {body}",
+                code=ErrorCode.API_ERROR,
+                status_code=response.status_code,
             )
 
         logger.debug("Response received (%s)", response.status_code)
 
+        # orjson decodes the raw bytes directly, which is considerably faster
+        # than `response.json()` on large EOD and financials payloads.
         try:
-            return response.json()
-        except ValueError as exc:
-            raise FiindoClientError("Invalid JSON response") from exc
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError as exc:
+            raise FiindoClientError(
+                "Invalid JSON response", code=ErrorCode.INVALID_JSON
+            ) from exc
 
 
 
+    def _send(self, url: str, params: Optional[dict] = None) -> requests.Response:
+        """Issue a single GET request guarded by the circuit breaker,
+        rate limiter and bulkhead."""
+        # Hot path: skip building the record (and formatting `params`)
+        # unless debug output is actually enabled.
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("GET %s | params=%s", url, params)
+
+        # Fail fast while the API is known to be down instead of spending
+        # the full retry budget on every remaining request.
+        if not self._breaker.allow_request():
+            logger.warning("Circuit open, skipping GET %s", url)
+            raise FiindoClientError(
+                "Fiindo API unavailable: circuit open",
+                code=ErrorCode.CIRCUIT_OPEN,
+            )
+
+        if self._rate_limiter is not None:
+            self._rate_limiter.acquire()
+
+        try:
+            with self._in_flight:
+                response = self.session.get(url, params=params)
+        except Exception:
+            # Any failure must settle the call; otherwise a failed HALF_OPEN
+            # trial (e.g. a cache backend error) would leave the circuit stuck.
+            self._breaker.record_failure()
+            raise
+
+        # Only server-side errors count towards opening the circuit; a 4xx
+        # still proves the API is reachable.
+        if not response.ok and response.status_code >= 500:
+            self._breaker.record_failure()
+        else:
+            self._breaker.record_success()
+
+        return response
+
+    @staticmethod
+    def _retry_after(response: requests.Response) -> float:
+        """Return the delay requested by a `Retry-After` header, in seconds.
+
+        Accepts both delta-seconds and HTTP-date values. Falls back to one
+        second for a missing or unparsable header and is capped at
+        `RETRY_AFTER_MAX` so a bogus value cannot stall the ETL.
+        """
+        value = response.headers.get("Retry-After", 1)
+        try:
+            delay = float(value)
+        except (TypeError, ValueError):
+            try:
+                retry_at = parsedate_to_datetime(value)
+            except (TypeError, ValueError):
+                retry_at = None
+            if retry_at is None or retry_at.tzinfo is None:
+                delay = 1.0
+            else:
+                delay = (retry_at - datetime.now(timezone.utc)).total_seconds()
+        return min(max(delay, 0.0), FiindoClient.RETRY_AFTER_MAX)
+
     def get_symbols(self) -> List[str]:
         """Return the list of symbols available from the Fiindo API.
 
@@ -106,17 +402,21 @@ class FiindoClient:
 
         logger.info("Fetching symbols from Fiindo API")
 
-        data = self._get("/api/v1/symbols")
+        data = self._get_url(self._symbols_url)
 
         if not isinstance(data, dict):
             logger.error("Unexpected API response format: %s", type(data))
-            raise FiindoClientError("Unexpected API response format")
+            raise FiindoClientError(
+                "Unexpected API response format", code=ErrorCode.INVALID_FORMAT
+            )
 
         symbols = data.get("symbols")
 
         if not isinstance(symbols, list):
             logger.error("Missing or invalid 'symbols' field in response")
-            raise FiindoClientError("Missing or invalid 'symbols' field")
+            raise FiindoClientError(
+                "Missing or invalid 'symbols' field", code=ErrorCode.INVALID_FORMAT
+            )
 
         if not symbols:
             logger.warning("Fiindo API returned empty symbols list")
@@ -132,12 +432,13 @@ class FiindoClient:
         """
         logger.debug("Fetching general info for symbol=%s", symbol)
 
-        path = f"/api/v1/general/{symbol}"
-        data = self._get(path)
+        data = self._get_url(self._general_url.format(symbol=symbol))
 
         if not isinstance(data, dict):
             logger.error("Invalid general response for symbol=%s", symbol)
-            raise FiindoClientError("Invalid general response format")
+            raise FiindoClientError(
+                "Invalid general response format", code=ErrorCode.INVALID_FORMAT
+            )
 
         return data
     
@@ -149,12 +450,13 @@ class FiindoClient:
         """
         logger.debug("Fetching EOD data for symbol=%s", symbol)
 
-        path = f"/api/v1/eod/{symbol}"
-        data = self._get(path)
+        data = self._get_url(self._eod_url.format(symbol=symbol))
 
         if not isinstance(data, dict):
             logger.error("Invalid EOD response for symbol=%s", symbol)
-            raise FiindoClientError("Invalid EOD response format")
+            raise FiindoClientError(
+                "Invalid EOD response format", code=ErrorCode.INVALID_FORMAT
+            )
 
         return data
     
@@ -169,7 +471,8 @@ class FiindoClient:
         Raises `ValueError` for invalid `statement` values and
         `FiindoClientError` for invalid API responses.
         """
-        if statement not in self.VALID_STATEMENTS:
+        url = self._financials_urls.get(statement)
+        if url is None:
             raise ValueError(
                 f"Invalid statement '{statement}'. "
                 f"Must be one of {self.VALID_STATEMENTS}"
@@ -181,8 +484,7 @@ class FiindoClient:
             statement,
         )
 
-        path = f"/api/v1/financials/{symbol}/{statement}"
-        data = self._get(path)
+        data = self._get_url(url.format(symbol=symbol))
 
         if not isinstance(data, dict):
             logger.error(
@@ -190,9 +492,8 @@ class FiindoClient:
                 symbol,
                 statement,
             )
-            raise FiindoClientError("Invalid financials response format")
+            raise FiindoClientError(
+                "Invalid financials response format", code=ErrorCode.INVALID_FORMAT
+            )
 
         return data
-
-
-
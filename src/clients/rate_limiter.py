@@ -0,0 +1,47 @@
+"""Token-bucket rate limiter shared by the ETL worker threads."""
+
+import threading
+import time
+from typing import Optional
+
+
+class RateLimiter:
+    """Thread-safe token bucket limiting calls to `rate` per second.
+
+    Up to `burst` calls may pass immediately; after that each caller
+    reserves the next free slot and sleeps until it is due. Sleeping happens
+    outside the lock, so waiting threads don't block each other's
+    bookkeeping and are released in the order they arrived.
+    """
+
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1, int(rate))
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Take one token, sleeping until it is available.
+
+        Returns:
+            Seconds spent waiting.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst,
+                self._tokens + (now - self._updated) * self.rate,
+            )
+            self._updated = now
+            # Reserve the token even if it is not there yet; a negative
+            # balance is the queue of callers waiting for refills.
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+        if wait > 0:
+            time.sleep(wait)
+        return wait
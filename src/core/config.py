@@ -22,7 +22,17 @@ class Settings(BaseSettings):
 
     # HTTP
     HTTP_TIMEOUT: int = Field(default=10)
-    HTTP_RETRIES: int = Field(default=3,ge=2)
+    HTTP_RETRIES: int = Field(default=4,ge=2)
+    # Requests per second across all workers; 0 disables the limiter
+    HTTP_RATE_LIMIT: float = Field(default=5, ge=0)
+    HTTP_CIRCUIT_FAILURE_THRESHOLD: int = Field(default=5, ge=1)
+    HTTP_CIRCUIT_RECOVERY_TIME: int = Field(default=30, ge=1)
+
+    # HTTP response cache (useful for repeated runs during development)
+    HTTP_CACHE_ENABLED: bool = Field(default=False)
+    HTTP_CACHE_PATH: str = Field(default=".fiindo_cache")
+    HTTP_CACHE_EXPIRE: int = Field(default=12 * 60 * 60, ge=0)
+    HTTP_CACHE_GENERAL_EXPIRE: int = Field(default=7 * 24 * 60 * 60, ge=0)
 
     # Database
     DATABASE_URL: str = Field(
@@ -1,10 +1,35 @@
+import atexit
+import logging
+import queue
 from logging.config import dictConfig
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+# Background listener writing queued records to the real handlers.
+_listener: Optional[QueueListener] = None
+
+
+def stop_logging() -> None:
+    """Flush queued records and stop the background listener, if running."""
+    global _listener
+
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
 
 
 def setup_logging(log_level: str = "INFO") -> None:
     """
     Configure application-wide logging.
+
+    Records are handed to a `QueueHandler` and written by a `QueueListener`
+    on a background thread, so ETL worker threads never block on the
+    console handler's lock or on stream I/O.
     """
+    global _listener
+
+    stop_logging()
+
     dictConfig(
         {
             "version": 1,
@@ -26,3 +51,13 @@ def setup_logging(log_level: str = "INFO") -> None:
             },
         }
     )
+
+    root = logging.getLogger()
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+
+    _listener = QueueListener(log_queue, *root.handlers, respect_handler_level=True)
+    root.handlers = [QueueHandler(log_queue)]
+    _listener.start()
+
+
+atexit.register(stop_logging)
@@ -0,0 +1,41 @@
+"""Small shared helpers."""
+
+from datetime import date, datetime
+from typing import Any, Hashable, Optional
+
+
+def dig(data: Any, *keys: Hashable, default: Any = None) -> Any:
+    """Return the value at `keys` inside nested dicts/lists, or `default`.
+
+    `dig(d, "a", "b", 0)` is `d["a"]["b"][0]` without allocating an empty
+    dict for every missing level as chained `.get(key, {})` calls do.
+    Returns `default` if any level is missing or has the wrong type.
+    """
+    try:
+        for key in keys:
+            data = data[key]
+    except (KeyError, IndexError, TypeError):
+        return default
+    return data
+
+
+def to_float(value: Any) -> Optional[float]:
+    """Coerce an API number to `float`, passing `None` through.
+
+    The API occasionally sends numbers as strings (`"12.5"`); those are
+    converted too. Raises `ValueError`/`TypeError` for anything else.
+    """
+    return None if value is None else float(value)
+
+
+def parse_date(value: Any) -> date:
+    """Parse an ISO date, also accepting datetimes (`2024-06-30T00:00:00`).
+
+    Only the date part is kept. Raises `ValueError`/`TypeError` for
+    anything else.
+    """
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(value[:10])
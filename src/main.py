@@ -1,4 +1,7 @@
+import argparse
 import logging
+from typing import Optional, Sequence
+
 from src.models.base import init_db, SessionLocal
 from src.clients.fiindo_client import FiindoClient
 from src.services.etl import ETLService
@@ -6,7 +9,19 @@ from src.core.config import settings
 
 from src.core.logging import setup_logging  
 
-def main():
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Run the Fiindo ETL pipeline.")
+    parser.add_argument(
+        "--clear-cache",
+        action="store_true",
+        help="drop cached API responses (incl. company profiles) before running",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None):
+    args = parse_args(argv)
+
     # Setup Logging
     setup_logging(settings.LOG_LEVEL)
     logger = logging.getLogger(__name__)
@@ -22,6 +37,8 @@ def main():
     try:
         # Initialize Fiindo client
         client = FiindoClient()
+        if args.clear_cache:
+            client.clear_cache()
 
         # Initialize ETL service
         etl_service = ETLService(db=db, client=client)
@@ -7,16 +7,52 @@ This module exposes the SQLAlchemy `Base` declarative class, a configured
 The project uses SQLite by default (see `src.core.config.settings`).
 """
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy import create_engine, event, make_url
+from sqlalchemy.orm import DeclarativeBase, sessionmaker
+from sqlalchemy.pool import StaticPool
 
 from src.core.config import settings
 
-# Create engine with sqlite threading settings used in local development.
-engine = create_engine(
-    settings.DATABASE_URL,
-    connect_args={"check_same_thread": False}
-)
+
+def _engine_options(database_url: str) -> dict:
+    """Return `create_engine` keyword arguments for `database_url`.
+
+    File-based SQLite keeps SQLAlchemy's default `QueuePool`, so threads
+    check out their own connections. An in-memory SQLite database only
+    exists inside one connection, so it is shared through a `StaticPool`
+    instead of giving every thread its own empty database.
+    """
+    url = make_url(database_url)
+    if url.get_backend_name() != "sqlite":
+        return {}
+
+    # Sessions may be used from a different thread than the one that
+    # opened the connection (threaded ETL).
+    options = {"connect_args": {"check_same_thread": False}}
+    if url.database in (None, "", ":memory:"):
+        options["poolclass"] = StaticPool
+    return options
+
+
+engine = create_engine(settings.DATABASE_URL, **_engine_options(settings.DATABASE_URL))
+
+
+if engine.dialect.name == "sqlite":
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+        """Tune every new SQLite connection for the ETL write pattern.
+
+        WAL lets readers proceed while the ETL writes, and
+        `synchronous=NORMAL` only fsyncs at checkpoints instead of on
+        every commit, which is safe in WAL mode.
+        """
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.close()
+
 
 SessionLocal = sessionmaker(
     autocommit=False,
@@ -24,8 +60,8 @@ SessionLocal = sessionmaker(
     bind=engine,
 )
 
-# Declarative base for ORM models.
-Base = declarative_base()
+class Base(DeclarativeBase):
+    """Declarative base for ORM models (SQLAlchemy 2.0 typed mapping)."""
 
 
 def init_db() -> None:
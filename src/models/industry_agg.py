@@ -6,7 +6,11 @@ revenue) which are produced by the ETL pipeline and persisted for later
 analysis and reporting.
 """
 
-from sqlalchemy import Column, Integer, String, Float, DateTime, func
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import Integer, String, Float, DateTime, func
+from sqlalchemy.orm import Mapped, mapped_column
 
 from src.models.base import Base
 
@@ -25,12 +29,14 @@ class IndustryAggregation(Base):
 
     __tablename__ = "industry_aggregations"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
 
-    industry = Column(String, nullable=False)
+    industry: Mapped[str] = mapped_column(String, nullable=False)
 
-    avg_pe_ratio = Column(Float, nullable=True)
-    avg_revenue_growth = Column(Float, nullable=True)
-    total_revenue = Column(Float, nullable=True)
+    avg_pe_ratio: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    avg_revenue_growth: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    total_revenue: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
 
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    created_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
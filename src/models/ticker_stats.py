@@ -3,9 +3,17 @@
 `TickerStats` records computed metrics for a given symbol and reporting
 period (period_end). The ETL pipeline populates these records and the
 data is later used to produce industry aggregates and reports.
+
+`TickerStatsRow` is the plain, unmapped counterpart the ETL workers build;
+it is only turned into table rows when persisted.
 """
 
-from sqlalchemy import Column, Integer, String, Float, Date, DateTime, func
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Optional
+
+from sqlalchemy import Integer, String, Float, Date, DateTime, Index, func
+from sqlalchemy.orm import Mapped, mapped_column
 
 from src.models.base import Base
 
@@ -26,15 +34,39 @@ class TickerStats(Base):
     """
 
     __tablename__ = "ticker_stats"
+    __table_args__ = (
+        # Serves "latest stats for symbol" lookups via an index seek.
+        Index("ix_ticker_symbol_period", "symbol", "period_end"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+
+    symbol: Mapped[str] = mapped_column(String, nullable=False, index=True)
+    industry: Mapped[str] = mapped_column(String, nullable=False, index=True)
+    period_end: Mapped[date] = mapped_column(Date, nullable=False, index=True)
+    pe_ratio: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    revenue_growth_qoq: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    net_income_ttm: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    debt_ratio: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
 
-    id = Column(Integer, primary_key=True, index=True)
+    created_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
 
-    symbol = Column(String, nullable=False, index=True)
-    industry = Column(String, nullable=False, index=True)
-    period_end = Column(Date, nullable=False, index=True)
-    pe_ratio = Column(Float, nullable=True)
-    revenue_growth_qoq = Column(Float, nullable=True)
-    net_income_ttm = Column(Float, nullable=True)
-    debt_ratio = Column(Float, nullable=True)
 
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+@dataclass(slots=True)
+class TickerStatsRow:
+    """Computed ticker statistics before persistence.
+
+    Mirrors the writable columns of `TickerStats` without ORM
+    instrumentation, so building one per symbol in the worker threads is a
+    plain slotted object allocation.
+    """
+
+    symbol: str
+    industry: str
+    period_end: date
+    pe_ratio: Optional[float] = None
+    revenue_growth_qoq: Optional[float] = None
+    net_income_ttm: Optional[float] = None
+    debt_ratio: Optional[float] = None
@@ -4,6 +4,7 @@ This module provides simple persistence operations used by the ETL
 pipeline to save and query industry-level aggregations.
 """
 
+from typing import List
 from sqlalchemy.orm import Session
 from src.models.industry_agg import IndustryAggregation
 from src.repositories.base import BaseRepository
@@ -16,24 +17,38 @@ class IndustryRepository(BaseRepository):
     """Repository for industry aggregation persistence.
 
     Methods:
-        save(industry): Persist an `IndustryAggregation` instance.
+        save(industry): Persist a single `IndustryAggregation` instance.
+        save_all(industries): Persist several aggregations in one transaction.
         get_all(): Return all saved industry aggregations.
-        get_by_industry(industry): Get aggregation for a specific industry.
+        get_by_industry(industry): Get the latest aggregation for an industry.
+
+    Aggregations are append-only: every ETL run inserts a new row per
+    industry, so no read-modify-write upsert is needed on save.
     """
 
     def save(self, industry: IndustryAggregation):
-        """Persist the provided `IndustryAggregation` instance."""
-        # Optional: check whether Industry already exists → Update 
+        """Persist the provided `IndustryAggregation` instance.
+
+        Use `save_all` to write several aggregations in one transaction.
+        """
         self.db.add(industry)
         self.db.commit()
         logger.info("Saved industry aggregation: %s", industry.industry)
 
+    def save_all(self, industries: List[IndustryAggregation]):
+        """Persist all given aggregations with a single commit."""
+        if not industries:
+            return
+        self.db.add_all(industries)
+        self.db.commit()
+        logger.info("Saved %d industry aggregations", len(industries))
+
     def get_all(self):
         """Return all `IndustryAggregation` rows."""
         return self.db.query(IndustryAggregation).all()
 
     def get_by_industry(self, industry: str):
-        """Return the aggregation for the given industry, or `None`.
+        """Return the most recent aggregation for the given industry, or `None`.
 
         Args:
             industry: Industry name to look up.
@@ -41,5 +56,6 @@ class IndustryRepository(BaseRepository):
         return (
             self.db.query(IndustryAggregation)
             .filter(IndustryAggregation.industry == industry)
+            .order_by(IndustryAggregation.id.desc())
             .first()
         )
@@ -4,9 +4,10 @@ This repository provides helpers used by the ETL service to persist
 per-ticker computed metrics and to fetch them for downstream processing.
 """
 
-from typing import List
+from typing import List, Sequence, Union
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
-from src.models.ticker_stats import TickerStats
+from src.models.ticker_stats import TickerStats, TickerStatsRow
 from src.repositories.base import BaseRepository
 import logging
 
@@ -23,29 +24,65 @@ class TickerRepository(BaseRepository):
         get_by_symbol(symbol): Return the latest stats for `symbol`.
     """
 
+    # Columns populated by the ETL; `id` and `created_at` are set by the DB.
+    INSERT_COLUMNS = (
+        "symbol",
+        "industry",
+        "period_end",
+        "pe_ratio",
+        "revenue_growth_qoq",
+        "net_income_ttm",
+        "debt_ratio",
+    )
+
     def save(self, ticker: TickerStats):
         """Persist a single `TickerStats` instance and commit."""
         self.db.add(ticker)
         self.db.commit()
         logger.debug("Saved ticker: %s", ticker.symbol)
 
-    def bulk_save(self, tickers: List[TickerStats]):
-        """Bulk insert a list of `TickerStats` objects.
+    def bulk_save(
+        self, tickers: Sequence[Union[TickerStats, TickerStatsRow]]
+    ) -> List[int]:
+        """Bulk insert `TickerStatsRow` (or transient `TickerStats`) objects.
+
+        If `tickers` is empty the method returns immediately. Rows are
+        passed to a single Core `insert()` so SQLAlchemy batches them into
+        multi-row INSERT statements instead of tracking ORM state per row.
 
-        If `tickers` is empty the method returns immediately. Uses
-        SQLAlchemy's `bulk_save_objects` to reduce insert overhead for
-        large batches.
+        Returns:
+            Generated primary keys, in the order of `tickers`. They are
+            fetched with `RETURNING` in the same batched statements, so no
+            follow-up query is needed.
         """
         if not tickers:
-            return
-        self.db.bulk_save_objects(tickers)
+            return []
+        rows = [
+            {column: getattr(ticker, column) for column in self.INSERT_COLUMNS}
+            for ticker in tickers
+        ]
+        result = self.db.execute(
+            insert(TickerStats).returning(TickerStats.id, sort_by_parameter_order=True),
+            rows,
+        )
+        ids = list(result.scalars())
         self.db.commit()
         logger.info("Bulk saved %d tickers", len(tickers))
+        return ids
 
     def get_all(self) -> List[TickerStats]:
         """Return all `TickerStats` rows from the database."""
         return self.db.query(TickerStats).all()
 
     def get_by_symbol(self, symbol: str) -> TickerStats:
-        """Return the `TickerStats` row for `symbol`, or `None` if missing."""
-        return self.db.query(TickerStats).filter(TickerStats.symbol == symbol).first()
+        """Return the latest `TickerStats` row for `symbol`, or `None` if missing.
+
+        "Latest" is the row with the most recent `period_end`; the query is
+        served by the composite `(symbol, period_end)` index.
+        """
+        return (
+            self.db.query(TickerStats)
+            .filter(TickerStats.symbol == symbol)
+            .order_by(TickerStats.period_end.desc())
+            .first()
+        )
@@ -4,12 +4,19 @@ Balance sheet data typically includes:
 - Assets, liabilities, and equity (snapshot at fiscal period end)
 - Available in both annual (FY) and quarterly (Q) granularity
 """
+import logging
+from dataclasses import dataclass
 from datetime import date
+from operator import attrgetter
 from typing import Optional
-from pydantic import BaseModel
 
+from src.core.utils import dig, parse_date, to_float
 
-class BalanceSheetSchema(BaseModel):
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True, frozen=True)
+class BalanceSheetSchema:
     """Normalized balance sheet record for a single fiscal period.
     
     Attributes:
@@ -40,20 +47,26 @@ class BalanceSheetCollection:
         # Sort by period_end descending (newest first)
         self.items = sorted(
             items,
-            key=lambda x: x.period_end,
+            key=attrgetter("period_end"),
             reverse=True
         )
 
+        # Partition once so period lookups don't rescan `items` on every call
+        self._fy: list[BalanceSheetSchema] = []
+        self._quarters: list[BalanceSheetSchema] = []
+        for item in self.items:
+            if item.period == "FY":
+                self._fy.append(item)
+            elif item.period[:1] == "Q":
+                self._quarters.append(item)
+
     def latest_year(self) -> BalanceSheetSchema | None:
         """Get the most recent annual (FY) balance sheet.
         
         Returns:
             Latest annual balance sheet, or None if not available.
         """
-        return next(
-            (i for i in self.items if i.period == "FY"),
-            None
-        )
+        return self._fy[0] if self._fy else None
 
     def latest_quarter(self) -> BalanceSheetSchema | None:
         """Get the most recent quarterly (Q1-Q4) balance sheet.
@@ -61,16 +74,14 @@ class BalanceSheetCollection:
         Returns:
             Latest quarterly balance sheet, or None if not available.
         """
-        return next(
-            (i for i in self.items if i.period.startswith("Q")),
-            None
-        )
+        return self._quarters[0] if self._quarters else None
 
 def parse_balance_sheets(api_response: dict) -> BalanceSheetCollection:
     """Parse raw Fiindo API response into a normalized BalanceSheetCollection.
     
     Extracts balance sheet data from nested API response structure and creates
-    BalanceSheetSchema objects with validated fields.
+    BalanceSheetSchema objects. Malformed rows (not a dict, missing
+    required fields or unparsable values) are skipped and counted in a warning.
     
     Args:
         api_response: Raw dict response from Fiindo API.
@@ -78,26 +89,32 @@ def parse_balance_sheets(api_response: dict) -> BalanceSheetCollection:
     Returns:
         BalanceSheetCollection with parsed and sorted items.
     """
-    data = (
-        api_response
-        .get("fundamentals", {})
-        .get("financials", {})
-        .get("balance_sheet_statement", {})
-        .get("data", [])
+    data = dig(
+        api_response, "fundamentals", "financials", "balance_sheet_statement", "data",
+        default=[],
     )
 
-    items = [
-        BalanceSheetSchema(
-            symbol=item["symbol"],
-            period=item["period"],
-            period_end=item["date"],
-            calendar_year=int(item["calendarYear"]),
-            total_assets=item.get("totalAssets"),
-            total_liabilities=item.get("totalLiabilities"),
-            total_equity=item.get("totalEquity"),
-            total_debt=item.get("totalDebt"),
-        )
-        for item in data
-    ]
+    items = []
+    skipped = 0
+    for item in data:
+        # Skip malformed rows instead of failing the whole statement
+        try:
+            if not (item["symbol"] and item["period"]):
+                raise ValueError("missing symbol or period")
+            items.append(
+                BalanceSheetSchema(
+                    symbol=item["symbol"],
+                    period=item["period"],
+                    period_end=parse_date(item["date"]),
+                    calendar_year=int(item["calendarYear"]),
+                    total_equity=to_float(item.get("totalEquity")),
+                    total_debt=to_float(item.get("totalDebt")),
+                )
+            )
+        except (KeyError, ValueError, TypeError, AttributeError):
+            skipped += 1
+
+    if skipped:
+        logger.warning("Skipped %d malformed balance sheet rows", skipped)
 
     return BalanceSheetCollection(items)
@@ -4,12 +4,19 @@ EOD price data includes:
 - Open, high, low, close prices and trading volume
 - Daily granularity (one record per trading day)
 """
+import logging
+from dataclasses import dataclass
 from datetime import date
+from operator import attrgetter
 from typing import Optional
-from pydantic import BaseModel
 
+from src.core.utils import dig, parse_date, to_float
 
-class EODPriceSchema(BaseModel):
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True, frozen=True)
+class EODPriceSchema:
     """Normalized EOD price record for a single trading day.
     
     Attributes:
@@ -42,7 +49,7 @@ class EODPriceCollection:
         # Sort by date descending (newest first)
         self.items = sorted(
             items,
-            key=lambda x: x.date,
+            key=attrgetter("date"),
             reverse=True
         )
 
@@ -67,7 +74,8 @@ def parse_eod_prices(symbol: str, api_response: list[dict]) -> EODPriceCollectio
     """Parse raw Fiindo API response into a normalized EODPriceCollection.
     
     Extracts end-of-day price data from nested API response structure and creates
-    EODPriceSchema objects with validated fields.
+    EODPriceSchema objects. Malformed rows (not a dict, missing
+    required fields or unparsable values) are skipped and counted in a warning.
     
     Args:
         symbol: Stock ticker symbol (used to populate schema symbol field).
@@ -77,23 +85,28 @@ def parse_eod_prices(symbol: str, api_response: list[dict]) -> EODPriceCollectio
         EODPriceCollection with parsed and sorted items.
     """
 
-    data = (
-        api_response
-        .get("stockprice", {})
-        .get("data", {})
-    )
-       
-    items = [
-        EODPriceSchema(
-            symbol=symbol,
-            date=item["date"],
-            open=item.get("open"),
-            high=item.get("high"),
-            low=item.get("low"),
-            close=item.get("close"),
-            volume=item.get("volume"),
-        )
-        for item in data
-    ]
+    data = dig(api_response, "stockprice", "data", default=[])
+
+    items = []
+    skipped = 0
+    for item in data:
+        # Skip malformed rows instead of failing the whole price history
+        try:
+            items.append(
+                EODPriceSchema(
+                    symbol=symbol,
+                    date=parse_date(item["date"]),
+                    open=to_float(item.get("open")),
+                    high=to_float(item.get("high")),
+                    low=to_float(item.get("low")),
+                    close=to_float(item.get("close")),
+                    volume=to_float(item.get("volume")),
+                )
+            )
+        except (KeyError, ValueError, TypeError, AttributeError):
+            skipped += 1
+
+    if skipped:
+        logger.warning("Skipped %d malformed EOD price rows", skipped)
 
     return EODPriceCollection(items)
@@ -4,12 +4,19 @@ Income statement data typically includes:
 - Revenue, net income, earnings per share (EPS)
 - Available in both annual (FY) and quarterly (Q) granularity
 """
+import logging
+from dataclasses import dataclass
 from datetime import date
+from operator import attrgetter
 from typing import Optional
-from pydantic import BaseModel
 
+from src.core.utils import dig, parse_date, to_float
 
-class IncomeStatementSchema(BaseModel):
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True, frozen=True)
+class IncomeStatementSchema:
     """Normalized income statement record for a single fiscal period.
     
     Attributes:
@@ -43,20 +50,26 @@ class IncomeStatementCollection:
         # Sort by period_end descending (newest first)
         self.items = sorted(
             items,
-            key=lambda x: x.period_end,
+            key=attrgetter("period_end"),
             reverse=True
         )
 
+        # Partition once so period lookups don't rescan `items` on every call
+        self._fy: list[IncomeStatementSchema] = []
+        self._quarters: list[IncomeStatementSchema] = []
+        for item in self.items:
+            if item.period == "FY":
+                self._fy.append(item)
+            elif item.period[:1] == "Q":
+                self._quarters.append(item)
+
     def latest_quarter(self) -> IncomeStatementSchema | None:
         """Get the most recent quarterly (Q1-Q4) income statement.
         
         Returns:
             Latest quarterly statement, or None if not available.
         """
-        return next(
-            (i for i in self.items if i.period.startswith("Q")),
-            None
-        )
+        return self._quarters[0] if self._quarters else None
 
     def previous_quarter(self) -> IncomeStatementSchema | None:
         """Get the second-most recent quarterly income statement.
@@ -66,8 +79,7 @@ class IncomeStatementCollection:
         Returns:
             Previous quarter statement, or None if fewer than 2 quarters available.
         """
-        quarters = [i for i in self.items if i.period.startswith("Q")]
-        return quarters[1] if len(quarters) > 1 else None
+        return self._quarters[1] if len(self._quarters) > 1 else None
 
     def last_n_quarters(self, n: int) -> list[IncomeStatementSchema]:
         """Get the most recent n quarterly income statements.
@@ -80,7 +92,7 @@ class IncomeStatementCollection:
         Returns:
             List of up to n most recent quarterly statements (newest first).
         """
-        return [i for i in self.items if i.period.startswith("Q")][:n]
+        return self._quarters[:n]
 
     def latest_year(self) -> IncomeStatementSchema | None:
         """Get the most recent annual (FY) income statement.
@@ -88,10 +100,7 @@ class IncomeStatementCollection:
         Returns:
             Latest annual statement, or None if not available.
         """
-        return next(
-            (i for i in self.items if i.period == "FY"),
-            None
-        )
+        return self._fy[0] if self._fy else None
 
 
 
@@ -99,7 +108,8 @@ def parse_income_statements(api_response: dict) -> IncomeStatementCollection:
     """Parse raw Fiindo API response into a normalized IncomeStatementCollection.
     
     Extracts income statement data from nested API response structure and creates
-    IncomeStatementSchema objects with validated fields.
+    IncomeStatementSchema objects. Malformed rows (not a dict, missing
+    required fields or unparsable values) are skipped and counted in a warning.
     
     Args:
         api_response: Raw dict response from Fiindo API.
@@ -107,25 +117,33 @@ def parse_income_statements(api_response: dict) -> IncomeStatementCollection:
     Returns:
         IncomeStatementCollection with parsed and sorted items.
     """
-    data = (
-        api_response
-        .get("fundamentals", {})
-        .get("financials", {})
-        .get("income_statement", {})
-        .get("data", [])
+    data = dig(
+        api_response, "fundamentals", "financials", "income_statement", "data",
+        default=[],
     )
 
-    items = [
-        IncomeStatementSchema(
-            symbol=item["symbol"],
-            period=item["period"],
-            period_end=item["date"],
-            calendar_year=int(item["calendarYear"]),
-            revenue=item.get("revenue"),
-            net_income=item.get("netIncome"),
-            eps=item.get("eps"),
-        )
-        for item in data
-    ]
+    items = []
+    skipped = 0
+    for item in data:
+        # Skip malformed rows instead of failing the whole statement
+        try:
+            if not (item["symbol"] and item["period"]):
+                raise ValueError("missing symbol or period")
+            items.append(
+                IncomeStatementSchema(
+                    symbol=item["symbol"],
+                    period=item["period"],
+                    period_end=parse_date(item["date"]),
+                    calendar_year=int(item["calendarYear"]),
+                    revenue=to_float(item.get("revenue")),
+                    net_income=to_float(item.get("netIncome")),
+                    eps=to_float(item.get("eps")),
+                )
+            )
+        except (KeyError, ValueError, TypeError, AttributeError):
+            skipped += 1
+
+    if skipped:
+        logger.warning("Skipped %d malformed income statement rows", skipped)
 
     return IncomeStatementCollection(items)
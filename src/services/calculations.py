@@ -1,6 +1,11 @@
-from typing import Optional, List, Dict
+import math
+from operator import attrgetter
+from typing import Optional, List, Dict, Sequence, Union
 
-from src.models.ticker_stats import TickerStats
+from src.models.ticker_stats import TickerStats, TickerStatsRow
+
+# Reads all aggregated metrics of a ticker in one C-level call.
+_AGGREGATED_METRICS = attrgetter("pe_ratio", "revenue_growth_qoq", "net_income_ttm")
 
 
 class CalculationService:
@@ -17,7 +22,7 @@ class CalculationService:
         """
         Price-to-Earnings ratio.
         """
-        if eps == 0 or eps is None:
+        if eps is None or eps == 0:
             return None
         return price / eps
 
@@ -26,30 +31,35 @@ class CalculationService:
         """
         Quarter-over-quarter revenue growth.
         """
-        if previous_revenue in (0, None):
+        if previous_revenue is None or previous_revenue == 0:
             return None
         return (current_revenue - previous_revenue) / previous_revenue
 
     @staticmethod
-    def calculate_net_income_ttm(last_4_quarters: List[float]) -> Optional[float]:
+    def calculate_net_income_ttm(last_4_quarters: List[Optional[float]]) -> Optional[float]:
         """
         Trailing twelve months net income.
+        Returns None unless all four quarters are reported.
         """
         if not last_4_quarters or len(last_4_quarters) != 4:
             return None
-        return sum(last_4_quarters)
+        if any(q is None for q in last_4_quarters):
+            return None
+        return math.fsum(last_4_quarters)
 
     @staticmethod
     def calculate_debt_ratio(total_debt: float, total_equity: float) -> Optional[float]:
         """
         Debt-to-equity ratio.
         """
-        if total_equity in (0, None):
+        if total_equity is None or total_equity == 0:
             return None
         return total_debt / total_equity
 
     @staticmethod
-    def aggregate_industry_metrics(tickers: List[TickerStats]) -> Dict:
+    def aggregate_industry_metrics(
+        tickers: Sequence[Union[TickerStats, TickerStatsRow]],
+    ) -> Dict:
         """
         Calculate industry-level aggregates.
         Expected tickers: List of dicts with keys:
@@ -57,20 +67,28 @@ class CalculationService:
         - revenue_growth_qoq
         - net_income
         """
-        n = len(tickers)
-        if n == 0:
+        if not tickers:
             return {
                 "avg_pe_ratio": None,
                 "avg_revenue_growth": None,
                 "total_revenue": None,
             }
 
-        pe_values = [t.pe_ratio for t in tickers if t.pe_ratio is not None]
-        rev_values = [t.revenue_growth_qoq for t in tickers if t.revenue_growth_qoq is not None]
-        revenue_sum = sum(t.net_income_ttm or 0 for t in tickers)
+        # Single pass with running sums instead of building a filtered list
+        # per metric and summing each one again.
+        pe_sum = rev_sum = revenue_sum = 0
+        pe_count = rev_count = 0
+        for pe, rev, net_income_ttm in map(_AGGREGATED_METRICS, tickers):
+            if pe is not None:
+                pe_sum += pe
+                pe_count += 1
+            if rev is not None:
+                rev_sum += rev
+                rev_count += 1
+            revenue_sum += net_income_ttm or 0
 
-        avg_pe = sum(pe_values)/len(pe_values) if pe_values else None
-        avg_rev = sum(rev_values)/len(rev_values) if rev_values else None
+        avg_pe = pe_sum / pe_count if pe_count else None
+        avg_rev = rev_sum / rev_count if rev_count else None
 
         return {
             "avg_pe_ratio": avg_pe,
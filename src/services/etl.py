@@ -1,6 +1,8 @@
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Dict, Any, List
+from collections import defaultdict
+from concurrent.futures import FIRST_COMPLETED, Executor, ThreadPoolExecutor, wait
+from itertools import islice
+from typing import Dict, Any, FrozenSet, Iterable, Iterator, List
 
 from src.core.config import settings
 from src.schemas.balance_sheet import parse_balance_sheets
@@ -8,7 +10,7 @@ from src.schemas.eod import parse_eod_prices
 from src.schemas.income_statement import parse_income_statements
 from src.clients.fiindo_client import FiindoClient, FiindoClientError
 from src.services.calculations import CalculationService
-from src.models.ticker_stats import TickerStats
+from src.models.ticker_stats import TickerStatsRow
 from src.models.industry_agg import IndustryAggregation
 from src.repositories.ticker_repo import TickerRepository
 from src.repositories.industry_repo import IndustryRepository
@@ -27,10 +29,11 @@ class ETLService:
     Workflow:
     1. Fetch all available stock symbols from the API
     2. Process each symbol in parallel:
-       - Fetch general info, income statements, balance sheets, and EOD prices
+       - Fetch general info, then income statements, balance sheets, and EOD
+         prices concurrently
        - Extract and validate industry classification
        - Calculate key financial metrics (PE ratio, revenue growth, TTM, debt ratio)
-       - Create TickerStats record
+       - Create TickerStatsRow record
     3. Persist ticker stats to database
     4. Aggregate metrics by industry and persist aggregations
     """
@@ -38,11 +41,26 @@ class ETLService:
     # Conservative worker count to match API rate limit (5 RPS).
     MAX_WORKERS = settings.ETL_MAX_WORKERS
 
-    ALLOWED_INDUSTRIES = [
+    # Symbols submitted to the pool at any time. Enough to keep every worker
+    # busy without holding a future (and its result) for every symbol.
+    SYMBOL_WINDOW = MAX_WORKERS * 2
+
+    # Requests issued concurrently per symbol once it passes the industry filter
+    # (income statement, balance sheet, EOD prices).
+    FETCHES_PER_SYMBOL = 3
+
+    # Threads shared by all symbols for those per-symbol fetches.
+    FETCH_WORKERS = MAX_WORKERS * FETCHES_PER_SYMBOL
+
+    # Ticker stats are written in batches of this size while symbols are
+    # still being fetched, so commits overlap with network I/O.
+    SAVE_BATCH_SIZE = 50
+
+    ALLOWED_INDUSTRIES: FrozenSet[str] = frozenset({
         "Banks - Diversified",
         "Software - Application",
         "Consumer Electronics",
-    ]
+    })
 
     def __init__(self, db: Session, client: FiindoClient):
         """Initialize ETL service with database session and API client.
@@ -56,19 +74,25 @@ class ETLService:
         self.calc = CalculationService()
         self.ticker_repo = TickerRepository(db)
         self.industry_repo = IndustryRepository(db)
+        # One long-lived pool for the per-symbol fetches, so threads are reused
+        # instead of being started and joined for every symbol.
+        self._fetcher = ThreadPoolExecutor(
+            max_workers=self.FETCH_WORKERS,
+            thread_name_prefix="etl-fetch",
+        )
 
-    def _process_single_symbol(self, symbol: str) -> TickerStats | None:
+    def _process_single_symbol(self, symbol: str) -> TickerStatsRow | None:
         """Process a single stock symbol through the complete ETL pipeline.
         
         Fetches financial data from the API, validates industry classification,
-        normalizes data via Pydantic schemas, calculates metrics, and creates
-        a TickerStats record.
+        normalizes data via the typed schemas, calculates metrics, and creates
+        a TickerStatsRow record.
         
         Args:
             symbol: Stock ticker symbol (e.g., 'AAPL').
         
         Returns:
-            TickerStats object if processing succeeds and symbol passes industry filter.
+            TickerStatsRow if processing succeeds and symbol passes industry filter.
             None if processing fails or symbol is filtered out.
         
         Handles:
@@ -83,12 +107,17 @@ class ETLService:
             if industry not in self.ALLOWED_INDUSTRIES:
                 return None
 
-            # 2. Fetch raw financial data (API client enforces rate limiting)
-            income_raw = self.client.get_financials(symbol, "income_statement")
-            balance_raw = self.client.get_financials(symbol, "balance_sheet_statement")
-            eod_raw = self.client.get_eod(symbol)
+            # 2. Fetch raw financial data concurrently; the three requests are
+            #    independent, so per-symbol latency is the slowest call, not the sum
+            income_future = self._fetcher.submit(self.client.get_financials, symbol, "income_statement")
+            balance_future = self._fetcher.submit(self.client.get_financials, symbol, "balance_sheet_statement")
+            eod_future = self._fetcher.submit(self.client.get_eod, symbol)
+
+            income_raw = income_future.result()
+            balance_raw = balance_future.result()
+            eod_raw = eod_future.result()
 
-            # 3. Normalize data via Pydantic schemas
+            # 3. Normalize data via typed schemas
             income_q = parse_income_statements(income_raw)
             balance_fy = parse_balance_sheets(balance_raw)
             eod_prices = parse_eod_prices(symbol, eod_raw)
@@ -120,8 +149,8 @@ class ETLService:
                 total_equity=last_year_balance.total_equity,
             )
 
-            # 6. Create and return TickerStats model
-            ticker_stats = TickerStats(
+            # 6. Create and return a plain row; ORM work happens in bulk_save
+            ticker_stats = TickerStatsRow(
                 symbol=symbol,
                 industry=industry,
                 period_end=last_q.period_end,
@@ -146,7 +175,8 @@ class ETLService:
         Steps:
         1. Fetch all available stock symbols from API
         2. Process each symbol concurrently using ThreadPoolExecutor
-        3. Persist processed ticker stats to database
+        3. Persist processed ticker stats to database in batches of
+           `SAVE_BATCH_SIZE` as results arrive
         4. Aggregate metrics by industry and persist aggregations
         
         Returns:
@@ -155,7 +185,9 @@ class ETLService:
             - industries_processed: Number of industries with aggregated metrics
         """
         summary = {"tickers_processed": 0, "industries_processed": 0}
-        tickers_for_processing: List[TickerStats] = []
+        # Tickers bucketed by industry as they complete, for aggregation
+        tickers_by_industry: Dict[str, List[TickerStatsRow]] = defaultdict(list)
+        pending_save: List[TickerStatsRow] = []
         
         # 1. Fetch all available symbols
         symbols = self.client.get_symbols()
@@ -163,37 +195,31 @@ class ETLService:
 
         # 2. Process symbols concurrently with thread pool
         with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
-            # Submit all symbols for processing
-            future_to_symbol = {
-                executor.submit(self._process_single_symbol, sym): sym 
-                for sym in symbols
-            }
-            
             # Collect results as they complete (non-blocking)
-            for future in as_completed(future_to_symbol):
-                symbol = future_to_symbol[future]
-                result = future.result()
-                
+            for result in self._process_symbols(executor, symbols):
                 if result:
                     # Symbol was processed successfully and passed industry filter
-                    tickers_for_processing.append(result)
+                    tickers_by_industry[result.industry].append(result)
                     summary["tickers_processed"] += 1
 
-        logger.info("Processed %d symbols successfully", len(symbols))
-        logger.info("Found %d ticker stats to persist", summary["tickers_processed"])
+                    # 3. Persist tickers to database in batches
+                    pending_save.append(result)
+                    if len(pending_save) >= self.SAVE_BATCH_SIZE:
+                        self.ticker_repo.bulk_save(pending_save)
+                        pending_save = []
 
-        # 3. Persist tickers to database
-        self.ticker_repo.bulk_save(tickers_for_processing)
+        # Flush the last partial batch
+        self.ticker_repo.bulk_save(pending_save)
 
-        # 4. Aggregate metrics by industry and persist
-        for industry in self.ALLOWED_INDUSTRIES:
-            industry_tickers = [t for t in tickers_for_processing if t.industry == industry]
-            if not industry_tickers:
-                continue
+        logger.info("Processed %d symbols successfully", len(symbols))
+        logger.info("Persisted %d ticker stats", summary["tickers_processed"])
 
+        # 4. Aggregate metrics by industry and persist
+        aggregations: List[IndustryAggregation] = []
+        for industry, industry_tickers in tickers_by_industry.items():
             metrics = self.calc.aggregate_industry_metrics(industry_tickers)
 
-            self.industry_repo.save(
+            aggregations.append(
                 IndustryAggregation(
                     industry=industry,
                     avg_pe_ratio=metrics['avg_pe_ratio'],
@@ -204,6 +230,9 @@ class ETLService:
 
             summary["industries_processed"] += 1
 
+        # Write all industry aggregations in a single transaction
+        self.industry_repo.save_all(aggregations)
+
         logger.info(
             "ETL finished: %d tickers, %d industries",
             summary["tickers_processed"],
@@ -212,12 +241,43 @@ class ETLService:
 
         return summary
 
+    def _process_symbols(
+        self, executor: Executor, symbols: Iterable[str]
+    ) -> Iterator[TickerStatsRow | None]:
+        """Yield `_process_single_symbol` results in completion order.
+
+        Symbols are submitted through a rolling window of `SYMBOL_WINDOW`
+        futures: a new symbol is only submitted when an earlier one has
+        finished, so memory stays bounded by the window rather than the
+        size of the symbol universe.
+        """
+        symbol_iter = iter(symbols)
+        pending = {
+            executor.submit(self._process_single_symbol, sym)
+            for sym in islice(symbol_iter, self.SYMBOL_WINDOW)
+        }
+
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+
+            for sym in islice(symbol_iter, len(done)):
+                pending.add(executor.submit(self._process_single_symbol, sym))
+
+            for future in done:
+                yield future.result()
+
     @staticmethod
     def _extract_industry(general: Dict[str, Any]) -> str | None:
-        """Extract industry classification from API general info response."""
-        try:
-            return (
-                general["fundamentals"]["profile"]["data"][0]["industry"]
-            )
-        except (KeyError, IndexError, TypeError):
+        """Extract industry classification from API general info response.
+
+        Most symbols are filtered out here, so misses are handled with plain
+        type checks rather than by raising and catching exceptions.
+        """
+        fundamentals = general.get("fundamentals") if isinstance(general, dict) else None
+        profile = fundamentals.get("profile") if isinstance(fundamentals, dict) else None
+        data = profile.get("data") if isinstance(profile, dict) else None
+        if not isinstance(data, list) or not data or not isinstance(data[0], dict):
             return None
+
+        industry = data[0].get("industry")
+        return industry if isinstance(industry, str) else None
@@ -0,0 +1,88 @@
+"""Unit tests for the circuit breaker used by FiindoClient.
+
+Tests cover:
+- Opening after consecutive failures
+- Recovery window and HALF_OPEN trial calls
+- Resetting the failure count on success
+"""
+import pytest
+from unittest.mock import Mock
+
+from src.clients.breaker import CircuitBreaker, CircuitState
+
+
+@pytest.fixture
+def clock():
+    """Provide a controllable clock for the breaker."""
+    return Mock(return_value=100.0)
+
+
+@pytest.fixture
+def breaker(clock):
+    """Provide a breaker opening after 3 failures with a 30s recovery window."""
+    return CircuitBreaker(failure_threshold=3, recovery_time=30, clock=clock)
+
+
+def _fail(breaker, times):
+    for _ in range(times):
+        breaker.record_failure()
+
+
+class TestCircuitBreaker:
+    """Tests for CircuitBreaker state transitions."""
+
+    def test_starts_closed(self, breaker):
+        assert breaker.state is CircuitState.CLOSED
+        assert breaker.allow_request()
+
+    def test_opens_after_threshold(self, breaker):
+        """Consecutive failures up to the threshold open the circuit."""
+        _fail(breaker, 2)
+        assert breaker.state is CircuitState.CLOSED
+
+        breaker.record_failure()
+
+        assert breaker.state is CircuitState.OPEN
+        assert not breaker.allow_request()
+
+    def test_success_resets_failure_count(self, breaker):
+        """Failures must be consecutive to open the circuit."""
+        _fail(breaker, 2)
+        breaker.record_success()
+        _fail(breaker, 2)
+
+        assert breaker.state is CircuitState.CLOSED
+
+    def test_half_open_after_recovery_time(self, breaker, clock):
+        """After the recovery window exactly one trial call is allowed."""
+        _fail(breaker, 3)
+
+        clock.return_value = 129.0
+        assert not breaker.allow_request()
+
+        clock.return_value = 130.0
+        assert breaker.allow_request()
+        assert breaker.state is CircuitState.HALF_OPEN
+        assert not breaker.allow_request()
+
+    def test_successful_trial_closes_circuit(self, breaker, clock):
+        _fail(breaker, 3)
+        clock.return_value = 130.0
+        breaker.allow_request()
+
+        breaker.record_success()
+
+        assert breaker.state is CircuitState.CLOSED
+        assert breaker.allow_request()
+
+    def test_failed_trial_reopens_circuit(self, breaker, clock):
+        """A failed trial reopens the circuit and restarts the recovery window."""
+        _fail(breaker, 3)
+        clock.return_value = 130.0
+        breaker.allow_request()
+
+        breaker.record_failure()
+
+        assert breaker.state is CircuitState.OPEN
+        clock.return_value = 159.0
+        assert not breaker.allow_request()
@@ -83,14 +83,20 @@ class TestCalculateNetIncomeTTM:
         expected_sum = 20.0
         assert calc_service.calculate_net_income_ttm(quarters) == expected_sum
 
+    def test_ttm_is_exactly_rounded(self, calc_service):
+        """Large and small quarters don't lose precision to summation order."""
+        quarters = [1e16, 1.0, -1e16, 1.0]
+        assert calc_service.calculate_net_income_ttm(quarters) == 2.0
+
     @pytest.mark.parametrize("quarters", [
         [],
         [10.0, 5.0, 8.0],
         [10.0, 5.0, 8.0, 7.0, 2.0],
+        [10.0, None, 8.0, 7.0],
         None,
     ])
     def test_ttm_invalid_input(self, calc_service, quarters):
-        """Returns None for invalid TTM inputs (None or wrong length)."""
+        """Returns None for invalid TTM inputs (None, missing quarters or wrong length)."""
         assert calc_service.calculate_net_income_ttm(quarters) is None
 
 
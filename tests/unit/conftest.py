@@ -0,0 +1,21 @@
+"""Shared fixtures for the unit tests."""
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.models.base import Base
+
+
+@pytest.fixture
+def db():
+    """Provide a session bound to a fresh in-memory SQLite database.
+
+    Repository tests run the generated SQL for real without touching the
+    project database file.
+    """
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+    engine.dispose()
@@ -3,21 +3,24 @@
 This module contains unit-level tests for `ETLService`. It provides fixtures
 that mock the API client, parsing helpers, calculation service and
 repositories. Tests focus on the internal processing logic (single-symbol
-processing) and helper functions (payload extraction). End-to-end orchestration
-tests are intentionally excluded from the unit test suite.
+processing), the `run` orchestration against mocked collaborators and helper
+functions (payload extraction).
 
 Structure:
 - Fixtures and mock setup
 - Helpers for single-symbol processing
-- Unit test cases (processing, extraction)
+- Unit test cases (processing, orchestration, extraction)
 """
 
+import threading
+
 import pytest
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import call
 from datetime import date
 
 from src.services.etl import ETLService
-from src.models.ticker_stats import TickerStats
+from src.models.ticker_stats import TickerStatsRow
 from src.models.industry_agg import IndustryAggregation
 from src.clients.fiindo_client import FiindoClientError  # for error cases
 
@@ -111,8 +114,8 @@ def successful_processing_mocks(mocker):
     mock_client.get_financials.return_value = MOCK_RAW_DATA
     mock_client.get_eod.return_value = MOCK_RAW_DATA
     
-    # Expected TickerStats (with the mocked calculation results)
-    expected_ticker_stats = TickerStats(
+    # Expected TickerStatsRow (with the mocked calculation results)
+    expected_ticker_stats = TickerStatsRow(
         symbol="AAPL",
         industry="Software - Application",
         period_end=MOCK_LATEST_Q.period_end,
@@ -132,7 +135,7 @@ class TestETLServiceProcessingMethod:
     """Tests for the internal `_process_single_symbol` method."""
 
     def test_process_symbol_success(self, etl_service_setup, successful_processing_mocks):
-        """Successful processing path returns a TickerStats and triggers API & calc calls."""
+        """Successful processing path returns a TickerStatsRow and triggers API & calc calls."""
         service, _, _, _, _ = etl_service_setup
         mock_client_detail, mock_calc_detail, expected_ticker_stats = successful_processing_mocks
 
@@ -156,7 +159,7 @@ class TestETLServiceProcessingMethod:
         assert mock_calc_detail.calculate_debt_ratio.called
 
         # 3. Result verification
-        assert isinstance(result, TickerStats)
+        assert isinstance(result, TickerStatsRow)
         assert result.pe_ratio == expected_ticker_stats.pe_ratio
         assert result.net_income_ttm == expected_ticker_stats.net_income_ttm
 
@@ -185,6 +188,125 @@ class TestETLServiceProcessingMethod:
         assert result is None
         assert "API error for API_FAIL: Connection Refused" in caplog.text
 
+    def test_process_symbol_concurrent_fetch_error(self, etl_service_setup, successful_processing_mocks, caplog):
+        """An error in one of the concurrent per-symbol fetches aborts processing of that symbol."""
+        service, _, _, _, _ = etl_service_setup
+        service.client = successful_processing_mocks[0]
+
+        service.client.get_eod.side_effect = FiindoClientError("EOD unavailable")
+
+        result = service._process_single_symbol("AAPL")
+
+        assert result is None
+        assert "API error for AAPL: EOD unavailable" in caplog.text
+
+    def test_fetches_share_one_pool(self, etl_service_setup, successful_processing_mocks):
+        """Per-symbol fetches run on the service's long-lived fetch pool."""
+        service, _, _, _, _ = etl_service_setup
+        service.client = successful_processing_mocks[0]
+        threads = []
+        service.client.get_eod.side_effect = lambda symbol: threads.append(
+            threading.current_thread().name
+        ) or {}
+
+        for symbol in ("AAPL", "MSFT", "GOOGL"):
+            service._process_single_symbol(symbol)
+
+        assert len(threads) == 3
+        assert all(name.startswith("etl-fetch") for name in threads)
+
+
+class TestETLServiceProcessSymbols:
+    """Tests for the rolling submission window in `_process_symbols`."""
+
+    def test_yields_every_result_within_window(self, etl_service_setup, mocker):
+        service, _, _, _, _ = etl_service_setup
+        mocker.patch.object(ETLService, "SYMBOL_WINDOW", 2)
+        service._process_single_symbol = lambda sym: sym.lower()
+        symbols = ["AAPL", "MSFT", "GOOGL", "IBM", "ORCL"]
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            submit = mocker.spy(executor, "submit")
+            results = []
+            for result in service._process_symbols(executor, symbols):
+                # At most a full window pending plus the batch being yielded
+                assert submit.call_count - len(results) <= 2 * 2
+                results.append(result)
+
+        assert sorted(results) == sorted(s.lower() for s in symbols)
+        assert submit.call_count == len(symbols)
+
+
+class TestETLServiceRun:
+    """Tests for the `run` orchestration: batched saves and aggregation."""
+
+    INDUSTRIES = {
+        "AAPL": "Consumer Electronics",
+        "MSFT": "Software - Application",
+        "ORCL": "Software - Application",
+        "SAP": "Software - Application",
+        "SONY": "Consumer Electronics",
+    }
+
+    @pytest.fixture
+    def service(self, etl_service_setup, mocker):
+        service, mock_client, mock_calc, _, _ = etl_service_setup
+        mocker.patch.object(ETLService, "SAVE_BATCH_SIZE", 2)
+        mock_client.get_symbols.return_value = [*self.INDUSTRIES, "FILTERED"]
+        service._process_single_symbol = lambda symbol: (
+            TickerStatsRow(
+                symbol=symbol,
+                industry=self.INDUSTRIES[symbol],
+                period_end=date(2025, 3, 31),
+            )
+            if symbol in self.INDUSTRIES else None
+        )
+        mock_calc.aggregate_industry_metrics.side_effect = lambda tickers: {
+            "avg_pe_ratio": float(len(tickers)),
+            "avg_revenue_growth": None,
+            "total_revenue": None,
+        }
+        return service
+
+    def test_tickers_are_saved_in_batches(self, service):
+        """Rows are flushed every SAVE_BATCH_SIZE results, then the remainder once."""
+        summary = service.run()
+
+        batches = [c.args[0] for c in service.ticker_repo.bulk_save.call_args_list]
+        assert [len(b) for b in batches] == [2, 2, 1]
+        assert sorted(t.symbol for b in batches for t in b) == sorted(self.INDUSTRIES)
+        assert summary == {"tickers_processed": 5, "industries_processed": 2}
+
+    def test_aggregations_are_saved_once(self, service):
+        """Tickers are bucketed per industry and all aggregations saved together."""
+        service.run()
+
+        buckets = {
+            c.args[0][0].industry: sorted(t.symbol for t in c.args[0])
+            for c in service.calc.aggregate_industry_metrics.call_args_list
+        }
+        assert buckets == {
+            "Consumer Electronics": ["AAPL", "SONY"],
+            "Software - Application": ["MSFT", "ORCL", "SAP"],
+        }
+
+        service.industry_repo.save_all.assert_called_once()
+        saved = service.industry_repo.save_all.call_args.args[0]
+        assert {a.industry: a.avg_pe_ratio for a in saved} == {
+            "Consumer Electronics": 2.0,
+            "Software - Application": 3.0,
+        }
+
+    def test_no_results(self, service):
+        """A run without matching symbols still flushes and saves nothing."""
+        service.client.get_symbols.return_value = ["FILTERED"]
+
+        summary = service.run()
+
+        service.ticker_repo.bulk_save.assert_called_once_with([])
+        service.industry_repo.save_all.assert_called_once_with([])
+        assert summary == {"tickers_processed": 0, "industries_processed": 0}
+
 
 class TestETLServiceExtractIndustry:
     """Unit tests for the `_extract_industry` helper used to parse API payloads."""
@@ -196,6 +318,9 @@ class TestETLServiceExtractIndustry:
         ({"fundamentals": {}}, None),
         ({"fundamentals": {"profile": {"data": []}}}, None),
         ({"fundamentals": {"profile": {"data": [1, {"industry": "Software - Application"}]}}}, None),
+        ({"fundamentals": {"profile": {"data": [{"industry": ["Banks"]}]}}}, None),
+        ({"fundamentals": {"profile": None}}, None),
+        ({"fundamentals": {"profile": {"data": {"industry": "Banks - Diversified"}}}}, None),
     ])
     def test_extract_industry(self, input_data, expected_industry):
         result = ETLService._extract_industry(input_data)
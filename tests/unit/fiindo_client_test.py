@@ -5,31 +5,87 @@ Tests cover:
 - Response parsing and validation
 - API endpoint methods (get_symbols, get_general, get_financials, get_eod)
 """
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+
+import orjson
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+import requests_cache
+from unittest.mock import Mock, patch
 from requests.exceptions import Timeout, ConnectionError
 
-from src.clients.fiindo_client import FiindoClient, FiindoClientError
+from urllib3.exceptions import ConnectTimeoutError, MaxRetryError, ReadTimeoutError
+from urllib3.util.retry import RequestHistory
 
+from src.clients.breaker import CircuitBreaker, CircuitState
+from src.clients.fiindo_client import (
+    ErrorCode,
+    FiindoClient,
+    FiindoClientError,
+    JitterRetry,
+    RETRY_AFTER_MAX,
+    RETRY_BACKOFF_MAX,
+    TimeoutHTTPAdapter,
+)
+from src.core.config import settings
 
-@pytest.fixture
+
+class FakeSession:
+    """Minimal stand-in for `requests.Session`.
+
+    Only `get` is a mock; headers are a plain dict and mounting adapters is
+    a no-op, which avoids MagicMock's per-attribute child creation.
+    """
+
+    def __init__(self):
+        self.headers = {}
+        self.get = Mock()
+
+    def mount(self, prefix, adapter):
+        pass
+
+
+def make_response(payload=None, *, content=None, ok=True, status=200, headers=None):
+    """Build a canned response; `payload` is JSON-encoded unless raw `content` is given."""
+    if content is None:
+        content = orjson.dumps(payload)
+    return SimpleNamespace(ok=ok, status_code=status, content=content, headers=headers or {})
+
+
+@pytest.fixture(scope="module")
 def mock_session():
-    """Mock requests.Session for HTTP operations."""
-    return MagicMock()
+    """Fake requests.Session for HTTP operations, built once per module."""
+    return FakeSession()
+
+
+@pytest.fixture(autouse=True)
+def reset_mock_session(mock_session):
+    """Clear recorded calls and canned responses between tests."""
+    mock_session.get.reset_mock(return_value=True, side_effect=True)
 
 
 @pytest.fixture
 def client(mock_session):
-    """Create FiindoClient with mocked session."""
-    with patch('src.clients.fiindo_client.requests.Session', return_value=mock_session):
-        client = FiindoClient(
-            base_url="https://api.test.fiindo.com",
-            auth_identifier="test.user",
-            timeout=10,
-            retries=3,
-        )
-        client.session = mock_session
-        return client
+    """Create FiindoClient with mocked session.
+
+    Function-scoped: each test gets fresh circuit breaker, bulkhead and
+    rate limiter state, while the (reset) session mock is shared. The mock
+    is assigned after construction rather than patched into
+    `_build_session`, whose cache would hand it to later clients.
+    """
+    client = FiindoClient(
+        base_url="https://api.test.fiindo.com",
+        auth_identifier="test.user",
+        timeout=10,
+        retries=3,
+        cache_path=None,
+    )
+    client.session = mock_session
+    return client
 
 
 class TestFiindoClientInitialization:
@@ -46,7 +102,7 @@ class TestFiindoClientInitialization:
         
         assert client.base_url == "https://api.test.fiindo.com"
         assert client.timeout == 15
-        assert "Bearer test.user" in client.session.headers.get("Authorization", "")
+        assert client.session.headers["Authorization"] == "Bearer test.user"
     
     
     def test_base_url_trailing_slash_removed(self):
@@ -54,16 +110,95 @@ class TestFiindoClientInitialization:
         client = FiindoClient(base_url="https://api.test.fiindo.com/")
         assert client.base_url == "https://api.test.fiindo.com"
 
+    def test_endpoints_prebuilt(self):
+        """Test that endpoint URLs are built once and only need the symbol."""
+        client = FiindoClient(base_url="https://api.test.fiindo.com/")
+
+        assert client._symbols_url == "https://api.test.fiindo.com/api/v1/symbols"
+        assert client._general_url.format(symbol="AAPL") == (
+            "https://api.test.fiindo.com/api/v1/general/AAPL"
+        )
+        assert client._eod_url.format(symbol="AAPL") == (
+            "https://api.test.fiindo.com/api/v1/eod/AAPL"
+        )
+        assert client._financials_urls["income_statement"].format(symbol="AAPL") == (
+            "https://api.test.fiindo.com/api/v1/financials/AAPL/income_statement"
+        )
+        assert set(client._financials_urls) == FiindoClient.VALID_STATEMENTS
+
+    def test_connection_pool_size(self):
+        """Test that the HTTP adapter keeps `pool_size` connections alive."""
+        client = FiindoClient(pool_size=24)
+
+        adapter = client.session.get_adapter("https://api.test.fiindo.com")
+        assert adapter._pool_maxsize == 24
+
+    def test_connection_pool_blocks_when_exhausted(self):
+        """Test that bursts reuse pooled connections instead of opening new ones."""
+        client = FiindoClient()
+
+        adapter = client.session.get_adapter("https://api.test.fiindo.com")
+        assert adapter._pool_block is True
+
+    def test_clients_with_same_settings_share_session(self):
+        """Test that the session and its connection pool are reused."""
+        first = FiindoClient(auth_identifier="shared.user", retries=5)
+        second = FiindoClient(auth_identifier="shared.user", retries=5)
+
+        assert first.session is second.session
+
+    def test_response_cache_disabled_by_default(self):
+        """Test that a plain session is used unless a cache path is given."""
+        client = FiindoClient(cache_path=None)
+        assert not isinstance(client.session, requests_cache.CachedSession)
+
+    def test_response_cache_enabled(self, tmp_path):
+        """Test that GET responses are cached on disk when a path is given."""
+        client = FiindoClient(cache_path=str(tmp_path / "fiindo_cache"))
+
+        assert isinstance(client.session, requests_cache.CachedSession)
+        assert client.session.settings.allowable_methods == ("GET",)
+
+    def test_clear_cache(self, tmp_path):
+        """Test that clear_cache empties the on-disk response cache."""
+        client = FiindoClient(cache_path=str(tmp_path / "fiindo_cache"))
+
+        with patch.object(client.session.cache, "clear") as clear:
+            client.clear_cache()
+
+        clear.assert_called_once_with()
+
+    def test_clear_cache_without_cache(self, client):
+        """Test that clear_cache only drops memoized lookups when caching is disabled."""
+        client.session.get.return_value = make_response({"symbols": ["AAPL"]})
+        client.get_symbols()
+
+        client.clear_cache()
+        client.get_symbols()
+
+        assert client.session.get.call_count == 2
+
+    def test_general_info_cached_longer(self, tmp_path):
+        """Test that general info responses use their own, longer cache TTL."""
+        from requests_cache.policy.expiration import get_url_expiration
+
+        client = FiindoClient(cache_path=str(tmp_path / "fiindo_cache"))
+        urls_expire_after = client.session.settings.urls_expire_after
+
+        assert get_url_expiration(
+            client._general_url.format(symbol="AAPL"), urls_expire_after
+        ) == settings.HTTP_CACHE_GENERAL_EXPIRE
+        assert get_url_expiration(
+            client._eod_url.format(symbol="AAPL"), urls_expire_after
+        ) is None
+
 
 class TestGetMethod:
     """Tests for the internal _get() method."""
     
     def test_get_success(self, client):
         """Test successful GET request."""
-        mock_response = Mock()
-        mock_response.ok = True
-        mock_response.json.return_value = {"data": "value"}
-        mock_response.status_code = 200
+        mock_response = make_response({"data": "value"})
         
         client.session.get.return_value = mock_response
         
@@ -74,9 +209,7 @@ class TestGetMethod:
     
     def test_get_with_params(self, client):
         """Test GET request with query parameters."""
-        mock_response = Mock()
-        mock_response.ok = True
-        mock_response.json.return_value = {"result": "ok"}
+        mock_response = make_response({"result": "ok"})
         
         client.session.get.return_value = mock_response
         
@@ -89,49 +222,254 @@ class TestGetMethod:
     
     def test_get_error_non_ok_response(self, client):
         """Test GET request that returns error status."""
-        mock_response = Mock()
-        mock_response.ok = False
-        mock_response.status_code = 404
-        mock_response.text = "Not Found"
+        mock_response = make_response(content=b"Not Found", ok=False, status=404)
         
         client.session.get.return_value = mock_response
         
         with pytest.raises(FiindoClientError) as exc_info:
             client._get("/api/v1/notfound")
         
-        assert "404" in str(exc_info.value)
+        assert exc_info.value.code is ErrorCode.API_ERROR
+        assert exc_info.value.status_code == 404
+        assert "Not Found" in str(exc_info.value)
+
+    def test_get_error_body_is_truncated(self, client):
+        """Test that large error bodies are truncated in the exception."""
+        mock_response = make_response(content=b"x" * 10_000, ok=False, status=500)
+
+        client.session.get.return_value = mock_response
+
+        with pytest.raises(FiindoClientError) as exc_info:
+            client._get("/api/v1/broken")
+
+        assert str(exc_info.value) == "Fiindo API error 500: " + "x" * FiindoClient.ERROR_BODY_MAX
     
     def test_get_invalid_json_response(self, client):
         """Test GET request with invalid JSON response."""
-        mock_response = Mock()
-        mock_response.ok = True
-        mock_response.json.side_effect = ValueError("Invalid JSON")
+        mock_response = make_response(content=b"{not json")
         
         client.session.get.return_value = mock_response
         
         with pytest.raises(FiindoClientError) as exc_info:
             client._get("/api/v1/test")
         
-        assert "Invalid JSON" in str(exc_info.value)
+        assert exc_info.value.code is ErrorCode.INVALID_JSON
+        assert isinstance(exc_info.value.__cause__, orjson.JSONDecodeError)
+
+    def test_get_decodes_raw_bytes(self, client):
+        """Test that the body is decoded from bytes without response.json()."""
+        client.session.get.return_value = make_response(
+            content='{"name": "Müller AG", "price": 1.5}'.encode("utf-8")
+        )
+
+        assert client._get("/api/v1/test") == {"name": "Müller AG", "price": 1.5}
     
+    def test_get_limits_requests_in_flight(self):
+        """Test that concurrent requests never exceed `max_in_flight`."""
+        in_flight = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def slow_get(*args, **kwargs):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.01)
+            with lock:
+                in_flight -= 1
+            response = make_response({"data": "value"})
+            return response
+
+        client = FiindoClient(max_in_flight=2, rate_limit=0)
+        with patch.object(client, "session") as session:
+            session.get.side_effect = slow_get
+            with ThreadPoolExecutor(max_workers=6) as executor:
+                list(executor.map(client._get, ["/api/v1/test"] * 12))
+
+        assert session.get.call_count == 12
+        assert peak == 2
+
+    def test_get_acquires_rate_limit_token(self, client):
+        """Test that every request first takes a token from the rate limiter."""
+        mock_response = make_response({"data": "value"})
+        client.session.get.return_value = mock_response
+
+        with patch.object(client, "_rate_limiter") as limiter:
+            client._get("/api/v1/test")
+            client._get("/api/v1/test")
+
+        assert limiter.acquire.call_count == 2
+
+    def test_rate_limit_disabled(self):
+        """Test that a rate limit of 0 disables the limiter."""
+        assert FiindoClient(rate_limit=0)._rate_limiter is None
+
+    def test_get_rate_limited_honours_retry_after(self, client):
+        """Test that a 429 is retried once after the Retry-After delay."""
+        throttled = make_response(ok=False, status=429, headers={"Retry-After": "3"})
+
+        success = make_response({"data": "value"})
+
+        client.session.get.side_effect = [throttled, success]
+
+        with patch("src.clients.fiindo_client.time.sleep") as sleep:
+            result = client._get("/api/v1/test")
+
+        assert result == {"data": "value"}
+        assert client.session.get.call_count == 2
+        sleep.assert_called_once()
+        assert 3.0 <= sleep.call_args[0][0] <= 3.0 + FiindoClient.RETRY_AFTER_JITTER
+
+    def test_get_unavailable_is_not_retried_again(self, client):
+        """Test that a 503 is not retried on top of the adapter's retries."""
+        client.session.get.return_value = make_response(
+            content=b"Service Unavailable", ok=False, status=503, headers={"Retry-After": "2"}
+        )
+
+        with patch("src.clients.fiindo_client.time.sleep") as sleep:
+            with pytest.raises(FiindoClientError):
+                client._get("/api/v1/test")
+
+        sleep.assert_not_called()
+        assert client.session.get.call_count == 1
+
+    @pytest.mark.parametrize("headers, expected_delay", [
+        ({}, 1.0),
+        ({"Retry-After": "garbage"}, 1.0),
+        ({"Retry-After": "600"}, FiindoClient.RETRY_AFTER_MAX),
+        ({"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}, 0.0),
+    ])
+    def test_retry_after_fallback_and_cap(self, headers, expected_delay):
+        """Test the Retry-After default for missing values and the upper cap."""
+        response = make_response(headers=headers)
+
+        assert FiindoClient._retry_after(response) == expected_delay
+
+    def test_retry_after_http_date(self):
+        """Test that an HTTP-date Retry-After is converted into a delay."""
+        retry_at = time.time() + 5
+        response = make_response(headers={
+            "Retry-After": time.strftime("%a, %d %b %Y %H:%M:%S GMT", time.gmtime(retry_at))
+        })
+
+        assert 3.0 <= FiindoClient._retry_after(response) <= 5.0
+
+    def test_get_rate_limited_twice_raises(self, client):
+        """Test that a second 429 surfaces as a FiindoClientError."""
+        throttled = make_response(
+            content=b"Too Many Requests", ok=False, status=429, headers={"Retry-After": "1"}
+        )
+
+        client.session.get.return_value = throttled
+
+        with patch("src.clients.fiindo_client.time.sleep"):
+            with pytest.raises(FiindoClientError) as exc_info:
+                client._get("/api/v1/test")
+
+        assert exc_info.value.status_code == 429
+        assert client.session.get.call_count == 2
+
     def test_get_timeout(self, client):
-        """Test GET request that times out."""
+        """Test that a timeout surfaces once the adapter's retries are exhausted."""
         client.session.get.side_effect = Timeout("Request timed out")
         
         with pytest.raises(Timeout):
             client._get("/api/v1/test")
 
 
+class TestCircuitBreaking:
+    """Tests for failing fast while the API is down."""
+
+    THRESHOLD = settings.HTTP_CIRCUIT_FAILURE_THRESHOLD
+
+    @pytest.fixture
+    def clock(self, client):
+        """Give the client's breaker a controllable clock.
+
+        The rate limiter is disabled so tripping the circuit doesn't wait
+        for token refills.
+        """
+        client._rate_limiter = None
+        clock = Mock(return_value=100.0)
+        client._breaker = CircuitBreaker(
+            failure_threshold=self.THRESHOLD,
+            recovery_time=settings.HTTP_CIRCUIT_RECOVERY_TIME,
+            clock=clock,
+        )
+        return clock
+
+    def _trip(self, client):
+        client.session.get.side_effect = Timeout("Request timed out")
+        for _ in range(self.THRESHOLD):
+            with pytest.raises(Timeout):
+                client._get("/api/v1/test")
+        client.session.get.reset_mock(side_effect=True)
+
+    def test_open_circuit_fails_fast(self, client, clock):
+        """Test that calls are rejected without touching the network once open."""
+        self._trip(client)
+
+        with pytest.raises(FiindoClientError) as exc_info:
+            client._get("/api/v1/test")
+
+        assert exc_info.value.code is ErrorCode.CIRCUIT_OPEN
+        client.session.get.assert_not_called()
+
+    def test_server_errors_trip_the_circuit(self, client, clock):
+        """Test that 5xx responses count as failures but 4xx do not."""
+        client.session.get.return_value = make_response(
+            content=b"Not Found", ok=False, status=404
+        )
+        for _ in range(self.THRESHOLD):
+            with pytest.raises(FiindoClientError):
+                client._get("/api/v1/test")
+        assert client._breaker.allow_request()
+
+        client.session.get.return_value = make_response(
+            content=b"Bad Gateway", ok=False, status=502
+        )
+        for _ in range(self.THRESHOLD):
+            with pytest.raises(FiindoClientError):
+                client._get("/api/v1/test")
+        assert not client._breaker.allow_request()
+
+    def test_unexpected_error_in_trial_reopens_circuit(self, client, clock):
+        """Test that a non-requests error during the trial call is recorded as a failure."""
+        self._trip(client)
+
+        clock.return_value += settings.HTTP_CIRCUIT_RECOVERY_TIME
+        client.session.get.side_effect = sqlite3.OperationalError("database is locked")
+        with pytest.raises(sqlite3.OperationalError):
+            client._get("/api/v1/test")
+
+        assert client._breaker.state is CircuitState.OPEN
+
+        clock.return_value += settings.HTTP_CIRCUIT_RECOVERY_TIME
+        client.session.get.side_effect = None
+        client.session.get.return_value = make_response({"data": "value"})
+        assert client._get("/api/v1/test") == {"data": "value"}
+
+    def test_success_after_recovery_closes_circuit(self, client, clock):
+        """Test that a successful trial call after the cooldown closes the circuit."""
+        self._trip(client)
+
+        clock.return_value += settings.HTTP_CIRCUIT_RECOVERY_TIME
+        client.session.get.return_value = make_response({"data": "value"})
+
+        assert client._get("/api/v1/test") == {"data": "value"}
+        assert client._get("/api/v1/test") == {"data": "value"}
+        assert client.session.get.call_count == 2
+
+
 class TestGetSymbols:
     """Tests for get_symbols() endpoint."""
     
     def test_get_symbols_success(self, client):
         """Test successful symbols fetch."""
-        mock_response = Mock()
-        mock_response.ok = True
-        mock_response.json.return_value = {
+        mock_response = make_response({
             "symbols": ["AAPL", "MSFT", "GOOGL"]
-        }
+        })
         
         client.session.get.return_value = mock_response
         
@@ -144,9 +482,7 @@ class TestGetSymbols:
     
     def test_get_symbols_empty_list(self, client):
         """Test symbols endpoint returning empty list."""
-        mock_response = Mock()
-        mock_response.ok = True
-        mock_response.json.return_value = {"symbols": []}
+        mock_response = make_response({"symbols": []})
         
         client.session.get.return_value = mock_response
         
@@ -154,31 +490,16 @@ class TestGetSymbols:
         
         assert result == []
     
-    def test_get_symbols_invalid_format(self, client):
-        """Test symbols endpoint returning invalid format."""
-        mock_response = Mock()
-        mock_response.ok = True
-        mock_response.json.return_value = "not a dict"  # Invalid format
-        
-        client.session.get.return_value = mock_response
-        
-        with pytest.raises(FiindoClientError) as exc_info:
-            client.get_symbols()
-        
-        assert "Unexpected API response format" in str(exc_info.value)
-    
     def test_get_symbols_missing_symbols_field(self, client):
         """Test symbols endpoint missing 'symbols' field."""
-        mock_response = Mock()
-        mock_response.ok = True
-        mock_response.json.return_value = {"data": []}  # No 'symbols' field
+        mock_response = make_response({"data": []})
         
         client.session.get.return_value = mock_response
         
         with pytest.raises(FiindoClientError) as exc_info:
             client.get_symbols()
         
-        assert "Missing or invalid 'symbols' field" in str(exc_info.value)
+        assert exc_info.value.code is ErrorCode.INVALID_FORMAT
 
 
 class TestGetGeneral:
@@ -186,15 +507,13 @@ class TestGetGeneral:
     
     def test_get_general_success(self, client):
         """Test successful general info fetch."""
-        mock_response = Mock()
-        mock_response.ok = True
-        mock_response.json.return_value = {
+        mock_response = make_response({
             "fundamentals": {
                 "profile": {
                     "data": [{"industry": "Software - Application"}]
                 }
             }
-        }
+        })
         
         client.session.get.return_value = mock_response
         
@@ -206,18 +525,52 @@ class TestGetGeneral:
         call_args = client.session.get.call_args
         assert "/api/v1/general/AAPL" in call_args[0][0]
     
-    def test_get_general_invalid_response(self, client):
-        """Test general endpoint returning invalid format."""
-        mock_response = Mock()
-        mock_response.ok = True
-        mock_response.json.return_value = ["not", "a", "dict"]  # Invalid format
-        
-        client.session.get.return_value = mock_response
-        
-        with pytest.raises(FiindoClientError) as exc_info:
-            client.get_general("AAPL")
-        
-        assert "Invalid general response format" in str(exc_info.value)
+
+class TestMemoizedLookups:
+    """get_symbols is memoized per client instance; get_general is not."""
+
+    def test_get_symbols_is_cached(self, client):
+        """Test that the symbol list is fetched once per client."""
+        client.session.get.return_value = make_response({"symbols": ["AAPL"]})
+
+        assert client.get_symbols() == client.get_symbols() == ["AAPL"]
+        assert client.session.get.call_count == 1
+
+    def test_errors_are_not_cached(self, client):
+        """Test that a failed lookup is retried on the next call."""
+        client.session.get.side_effect = [
+            make_response(content=b"Service Unavailable", ok=False, status=503),
+            make_response({"symbols": ["AAPL"]}),
+        ]
+
+        with pytest.raises(FiindoClientError):
+            client.get_symbols()
+
+        assert client.get_symbols() == ["AAPL"]
+
+    def test_cache_is_per_instance(self, client, mock_session):
+        """Test that memoized results are not shared between clients."""
+        client.session.get.return_value = make_response({"symbols": ["AAPL"]})
+        other = FiindoClient(base_url="https://api.test.fiindo.com")
+        other.session = mock_session
+
+        client.get_symbols()
+        other.get_symbols()
+
+        assert client.session.get.call_count == 2
+
+    def test_get_general_is_not_cached(self, client):
+        """Test that profiles are fetched per call, without holding them in memory."""
+        client.session.get.side_effect = [
+            make_response({"fundamentals": {}}),
+            make_response({"fundamentals": {}}),
+        ]
+
+        first = client.get_general("AAPL")
+        second = client.get_general("AAPL")
+
+        assert first is not second
+        assert client.session.get.call_count == 2
 
 
 class TestGetEOD:
@@ -225,15 +578,13 @@ class TestGetEOD:
     
     def test_get_eod_success(self, client):
         """Test successful EOD data fetch."""
-        mock_response = Mock()
-        mock_response.ok = True
-        mock_response.json.return_value = {
+        mock_response = make_response({
             "stockprice": {
                 "data": [
                     {"date": "2025-01-10", "close": 150.0, "volume": 1000000}
                 ]
             }
-        }
+        })
         
         client.session.get.return_value = mock_response
         
@@ -245,48 +596,28 @@ class TestGetEOD:
         call_args = client.session.get.call_args
         assert "/api/v1/eod/AAPL" in call_args[0][0]
     
-    def test_get_eod_invalid_response(self, client):
-        """Test EOD endpoint returning invalid format."""
-        mock_response = Mock()
-        mock_response.ok = True
-        mock_response.json.return_value = []  # Invalid format (not dict)
-        
-        client.session.get.return_value = mock_response
-        
-        with pytest.raises(FiindoClientError) as exc_info:
-            client.get_eod("AAPL")
-        
-        assert "Invalid EOD response format" in str(exc_info.value)
-
 
 class TestGetFinancials:
     """Tests for get_financials() endpoint."""
     
-    @pytest.mark.parametrize("statement_type", [
-        "income_statement",
-        "balance_sheet_statement",
-        "cash_flow_statement",
-    ])
-    def test_get_financials_valid_statements(self, client, statement_type):
+    def test_get_financials_valid_statements(self, client, subtests):
         """Test fetching each valid statement type."""
-        mock_response = Mock()
-        mock_response.ok = True
-        mock_response.json.return_value = {
-            "fundamentals": {
-                "financials": {
-                    statement_type: {"data": []}
-                }
-            }
-        }
-        
-        client.session.get.return_value = mock_response
-        
-        result = client.get_financials("AAPL", statement_type)
-        
-        assert isinstance(result, dict)
-        # Verify correct endpoint with statement type
-        call_args = client.session.get.call_args
-        assert f"/api/v1/financials/AAPL/{statement_type}" in call_args[0][0]
+        for statement_type in FiindoClient.STATEMENT_ORDER:
+            with subtests.test(statement=statement_type):
+                client.session.get.return_value = make_response({
+                    "fundamentals": {
+                        "financials": {
+                            statement_type: {"data": []}
+                        }
+                    }
+                })
+
+                result = client.get_financials("AAPL", statement_type)
+
+                assert isinstance(result, dict)
+                # Verify correct endpoint with statement type
+                call_args = client.session.get.call_args
+                assert f"/api/v1/financials/AAPL/{statement_type}" in call_args[0][0]
     
     def test_get_financials_invalid_statement(self, client):
         """Test get_financials with invalid statement type."""
@@ -294,19 +625,27 @@ class TestGetFinancials:
             client.get_financials("AAPL", "invalid_statement")
         
         assert "Invalid statement" in str(exc_info.value)
+        client.session.get.assert_not_called()
     
-    def test_get_financials_invalid_response(self, client):
-        """Test financials endpoint returning invalid format."""
-        mock_response = Mock()
-        mock_response.ok = True
-        mock_response.json.return_value = "not a dict"  # Invalid format
-        
+
+class TestInvalidResponseFormat:
+    """Endpoints reject well-formed JSON of the wrong shape."""
+
+    @pytest.mark.parametrize("method_name, args, payload, fragment", [
+        ("get_symbols", (), "not a dict", "Unexpected API response format"),
+        ("get_general", ("AAPL",), ["not", "a", "dict"], "Invalid general response format"),
+        ("get_eod", ("AAPL",), [], "Invalid EOD response format"),
+        ("get_financials", ("AAPL", "income_statement"), "not a dict", "Invalid financials response format"),
+    ])
+    def test_invalid_response_format(self, client, method_name, args, payload, fragment):
+        mock_response = make_response(payload)
+
         client.session.get.return_value = mock_response
-        
-        with pytest.raises(FiindoClientError) as exc_info:
-            client.get_financials("AAPL", "income_statement")
-        
-        assert "Invalid financials response format" in str(exc_info.value)
+
+        with pytest.raises(FiindoClientError, match=fragment) as exc_info:
+            getattr(client, method_name)(*args)
+
+        assert exc_info.value.code is ErrorCode.INVALID_FORMAT
 
 
 class TestValidStatements:
@@ -318,9 +657,180 @@ class TestValidStatements:
         assert "balance_sheet_statement" in FiindoClient.VALID_STATEMENTS
         assert "cash_flow_statement" in FiindoClient.VALID_STATEMENTS
     
-    def test_valid_statements_is_set(self):
-        """Test that VALID_STATEMENTS is a set (for fast lookup)."""
-        assert isinstance(FiindoClient.VALID_STATEMENTS, set)
+    def test_valid_statements_is_frozenset(self):
+        """Test that VALID_STATEMENTS is an immutable set (for fast lookup)."""
+        assert isinstance(FiindoClient.VALID_STATEMENTS, frozenset)
+
+    def test_statement_order_matches_valid_statements(self):
+        """Test that the ordered statements are exactly the valid statements."""
+        assert set(FiindoClient.STATEMENT_ORDER) == FiindoClient.VALID_STATEMENTS
+
+
+class TestJitterRetry:
+    """Tests for the full-jitter retry strategy."""
+
+    @staticmethod
+    def _retry_after_errors(errors):
+        history = tuple(
+            RequestHistory("GET", "/api/v1/test", None, 503, None)
+            for _ in range(errors)
+        )
+        return JitterRetry(total=5, backoff_factor=0.5, history=history)
+
+    def test_no_backoff_after_first_error(self):
+        """Test that the first retry is issued immediately."""
+        assert self._retry_after_errors(1).get_backoff_time() == 0
+
+    @pytest.mark.parametrize("errors, upper_bound", [
+        (2, 1.0),
+        (3, 2.0),
+        (4, 4.0),
+    ])
+    def test_backoff_is_drawn_up_to_exponential_bound(self, errors, upper_bound):
+        """Test that the delay is drawn uniformly from [0, exponential backoff]."""
+        retry = self._retry_after_errors(errors)
+
+        with patch("src.clients.fiindo_client.random.uniform", return_value=0.3) as uniform:
+            assert retry.get_backoff_time() == 0.3
+
+        uniform.assert_called_once_with(0, upper_bound)
+
+    def test_backoff_is_capped(self):
+        """Test that the exponential bound never exceeds RETRY_BACKOFF_MAX."""
+        history = tuple(
+            RequestHistory("GET", "/api/v1/test", None, 503, None) for _ in range(12)
+        )
+        retry = JitterRetry(
+            total=20, backoff_factor=0.5, backoff_max=RETRY_BACKOFF_MAX, history=history
+        )
+
+        with patch("src.clients.fiindo_client.random.uniform", return_value=1.0) as uniform:
+            retry.get_backoff_time()
+
+        uniform.assert_called_once_with(0, RETRY_BACKOFF_MAX)
+
+    @pytest.mark.parametrize("error", [
+        ConnectTimeoutError("connect timed out"),
+        ReadTimeoutError(None, "/api/v1/test", "read timed out"),
+    ])
+    def test_transient_errors_are_retried(self, error):
+        """Test that timeouts are retried until the retry budget is spent."""
+        retry = FiindoClient(retries=2).session.get_adapter(
+            "https://api.test.fiindo.com"
+        ).max_retries
+
+        retry = retry.increment(method="GET", url="/api/v1/test", error=error)
+        retry = retry.increment(method="GET", url="/api/v1/test", error=error)
+
+        assert retry.total == 0
+        with pytest.raises(MaxRetryError):
+            retry.increment(method="GET", url="/api/v1/test", error=error)
+
+    def test_client_backoff_max(self):
+        """Test that the mounted retry strategy caps its backoff."""
+        adapter = FiindoClient().session.get_adapter("https://api.test.fiindo.com")
+        assert adapter.max_retries.backoff_max == RETRY_BACKOFF_MAX
+
+    def test_client_mounts_timeout_adapter(self):
+        """Test that the request timeout is configured on the mounted adapter."""
+        adapter = FiindoClient(timeout=7).session.get_adapter("https://api.test.fiindo.com")
+
+        assert isinstance(adapter, TimeoutHTTPAdapter)
+        assert adapter.timeout == 7
+
+    @pytest.mark.parametrize("timeout, expected", [(None, 7), (2, 2)])
+    def test_timeout_adapter_defaults_timeout(self, timeout, expected):
+        """Test that the adapter fills in its timeout unless one is given."""
+        adapter = TimeoutHTTPAdapter(timeout=7)
+
+        with patch("src.clients.fiindo_client.HTTPAdapter.send") as send:
+            adapter.send(Mock(), timeout=timeout)
+
+        assert send.call_args.kwargs["timeout"] == expected
+
+    def test_client_uses_jitter_retry(self):
+        """Test that the mounted adapter retries with JitterRetry."""
+        client = FiindoClient(retries=4)
+
+        adapter = client.session.get_adapter("https://api.test.fiindo.com")
+        assert isinstance(adapter.max_retries, JitterRetry)
+        assert adapter.max_retries.total == 4
+
+
+class _UnavailableHandler(BaseHTTPRequestHandler):
+    """Answer `503` with a `Retry-After` for the first `server.failures` requests."""
+
+    def do_GET(self):
+        self.server.requests += 1
+        if self.server.requests <= self.server.failures:
+            self.send_response(503)
+            self.send_header("Retry-After", self.server.retry_after)
+            body = b"Service Unavailable"
+        else:
+            self.send_response(200)
+            body = b'{"data": "value"}'
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def unavailable_server():
+    """Start a local server that is unavailable for a number of requests."""
+    servers = []
+
+    def start(failures, retry_after):
+        server = ThreadingHTTPServer(("127.0.0.1", 0), _UnavailableHandler)
+        server.failures = failures
+        server.retry_after = retry_after
+        server.requests = 0
+        server.url = f"http://127.0.0.1:{server.server_port}"
+        threading.Thread(
+            target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True
+        ).start()
+        servers.append(server)
+        return server
+
+    yield start
+
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+class TestRetryAfterThroughAdapter:
+    """`Retry-After` on 503 is handled by the mounted adapter alone."""
+
+    @staticmethod
+    def _client(server, retries):
+        return FiindoClient(base_url=server.url, retries=retries, rate_limit=0, cache_path=None)
+
+    def test_retry_after_is_capped(self, unavailable_server):
+        """Test that a huge Retry-After is clamped to RETRY_AFTER_MAX."""
+        server = unavailable_server(failures=1, retry_after="600")
+
+        with patch("urllib3.util.retry.time.sleep") as sleep:
+            result = self._client(server, retries=2)._get("/api/v1/test")
+
+        assert result == {"data": "value"}
+        sleep.assert_called_once_with(RETRY_AFTER_MAX)
+        assert server.requests == 2
+
+    def test_exhausted_retries_are_not_repeated(self, unavailable_server):
+        """Test that a persistent 503 spends the retry budget exactly once."""
+        server = unavailable_server(failures=100, retry_after="2")
+
+        # `time` is shared, so this also catches any client-level sleep.
+        with patch("urllib3.util.retry.time.sleep") as sleep:
+            with pytest.raises(FiindoClientError) as exc_info:
+                self._client(server, retries=2)._get("/api/v1/test")
+
+        assert exc_info.value.status_code == 503
+        assert server.requests == 3
+        assert [c.args[0] for c in sleep.call_args_list] == [2.0, 2.0]
 
 
 class TestFiindoClientError:
@@ -336,3 +846,10 @@ class TestFiindoClientError:
         msg = "API returned 500 error"
         error = FiindoClientError(msg)
         assert str(error) == msg
+
+    def test_fiindo_client_error_defaults(self):
+        """Test that errors without details are classified as UNKNOWN."""
+        error = FiindoClientError("Test error")
+
+        assert error.code is ErrorCode.UNKNOWN
+        assert error.status_code is None
@@ -0,0 +1,45 @@
+"""Unit tests for IndustryRepository."""
+import pytest
+
+from src.models.industry_agg import IndustryAggregation
+from src.repositories.industry_repo import IndustryRepository
+
+
+@pytest.fixture
+def repo(db):
+    return IndustryRepository(db)
+
+
+class TestSaveAll:
+    """Tests for IndustryRepository.save_all and lookups."""
+
+    def test_save_all_persists_rows(self, repo, db):
+        repo.save_all([
+            IndustryAggregation(industry="Banks - Diversified", avg_pe_ratio=10.0),
+            IndustryAggregation(industry="Consumer Electronics", avg_pe_ratio=25.0),
+        ])
+        db.expunge_all()
+
+        assert {a.industry for a in repo.get_all()} == {
+            "Banks - Diversified",
+            "Consumer Electronics",
+        }
+
+    def test_save_commits_single_row(self, repo, db):
+        repo.save(IndustryAggregation(industry="Banks - Diversified", avg_pe_ratio=10.0))
+        db.rollback()
+
+        assert repo.get_by_industry("Banks - Diversified").avg_pe_ratio == 10.0
+
+    def test_save_all_empty_list(self, repo):
+        repo.save_all([])
+        assert repo.get_all() == []
+
+    def test_get_by_industry_returns_latest_run(self, repo):
+        """Aggregations are append-only; lookups return the newest row."""
+        repo.save_all([IndustryAggregation(industry="Banks - Diversified", avg_pe_ratio=10.0)])
+        repo.save_all([IndustryAggregation(industry="Banks - Diversified", avg_pe_ratio=12.0)])
+
+        assert len(repo.get_all()) == 2
+        assert repo.get_by_industry("Banks - Diversified").avg_pe_ratio == 12.0
+        assert repo.get_by_industry("Unknown") is None
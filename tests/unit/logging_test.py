@@ -0,0 +1,53 @@
+"""Unit tests for application logging setup.
+
+Tests cover:
+- Root logger routed through a QueueHandler
+- Records reaching the console via the background listener
+"""
+import logging
+from logging.handlers import QueueHandler
+
+import pytest
+
+import src.core.logging as app_logging
+
+
+@pytest.fixture
+def restore_root_logger():
+    """Restore root logger handlers and level after `setup_logging`."""
+    root = logging.getLogger()
+    handlers, level = root.handlers[:], root.level
+    yield root
+    app_logging.stop_logging()
+    root.handlers = handlers
+    root.setLevel(level)
+
+
+class TestSetupLogging:
+    """Tests for setup_logging."""
+
+    def test_root_uses_queue_handler(self, restore_root_logger):
+        app_logging.setup_logging("DEBUG")
+
+        assert len(restore_root_logger.handlers) == 1
+        assert isinstance(restore_root_logger.handlers[0], QueueHandler)
+        assert restore_root_logger.level == logging.DEBUG
+
+    def test_records_reach_console(self, restore_root_logger, capsys):
+        app_logging.setup_logging("INFO")
+
+        logging.getLogger("etl").info("hello %s", "world")
+        # Stopping the listener drains the queue.
+        app_logging.stop_logging()
+
+        err = capsys.readouterr().err
+        assert "INFO | etl | hello world" in err
+
+    def test_repeated_setup_replaces_listener(self, restore_root_logger):
+        app_logging.setup_logging("INFO")
+        first = app_logging._listener
+
+        app_logging.setup_logging("INFO")
+
+        assert app_logging._listener is not first
+        assert len(restore_root_logger.handlers) == 1
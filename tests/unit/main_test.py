@@ -0,0 +1,37 @@
+"""Unit tests for the command-line entry point."""
+import pytest
+
+from src import main as main_module
+
+
+@pytest.fixture
+def entry_point(mocker):
+    """Patch the database, client and ETL service used by `main`."""
+    mocker.patch.object(main_module, "setup_logging")
+    mocker.patch.object(main_module, "init_db")
+    db = mocker.patch.object(main_module, "SessionLocal").return_value
+    client = mocker.patch.object(main_module, "FiindoClient").return_value
+    etl = mocker.patch.object(main_module, "ETLService").return_value
+    etl.run.return_value = {"tickers_processed": 0, "industries_processed": 0}
+    return db, client, etl
+
+
+class TestMain:
+    """Tests for `main` and its arguments."""
+
+    def test_runs_etl_and_closes_session(self, entry_point):
+        db, client, etl = entry_point
+
+        main_module.main([])
+
+        etl.run.assert_called_once_with()
+        client.clear_cache.assert_not_called()
+        db.close.assert_called_once_with()
+
+    def test_clear_cache_flag(self, entry_point):
+        db, client, etl = entry_point
+
+        main_module.main(["--clear-cache"])
+
+        client.clear_cache.assert_called_once_with()
+        etl.run.assert_called_once_with()
@@ -0,0 +1,61 @@
+"""Unit tests for the token-bucket rate limiter used by FiindoClient.
+
+Tests cover:
+- Bursting up to capacity without waiting
+- Spacing callers once the bucket is empty
+- Refilling over time, capped at the burst size
+"""
+import pytest
+from unittest.mock import patch
+
+from src.clients.rate_limiter import RateLimiter
+
+
+@pytest.fixture
+def clock():
+    """Patch `time.monotonic` inside the limiter with a controllable clock."""
+    with patch("src.clients.rate_limiter.time.monotonic", return_value=100.0) as monotonic:
+        yield monotonic
+
+
+@pytest.fixture
+def sleep():
+    with patch("src.clients.rate_limiter.time.sleep") as sleep:
+        yield sleep
+
+
+class TestRateLimiter:
+    """Tests for RateLimiter.acquire."""
+
+    def test_burst_passes_without_waiting(self, clock, sleep):
+        limiter = RateLimiter(rate=5)
+
+        waits = [limiter.acquire() for _ in range(5)]
+
+        assert waits == [0.0] * 5
+        sleep.assert_not_called()
+
+    def test_waiting_callers_are_spaced(self, clock, sleep):
+        """Once empty, each caller reserves the next slot 1/rate apart."""
+        limiter = RateLimiter(rate=5)
+        for _ in range(5):
+            limiter.acquire()
+
+        assert limiter.acquire() == pytest.approx(0.2)
+        assert limiter.acquire() == pytest.approx(0.4)
+        assert sleep.call_count == 2
+
+    def test_refill_is_capped_at_burst(self, clock, sleep):
+        limiter = RateLimiter(rate=5, burst=2)
+        limiter.acquire()
+        limiter.acquire()
+
+        clock.return_value = 200.0
+        waits = [limiter.acquire() for _ in range(3)]
+
+        assert waits[:2] == [0.0, 0.0]
+        assert waits[2] == pytest.approx(0.2)
+
+    def test_rejects_non_positive_rate(self):
+        with pytest.raises(ValueError):
+            RateLimiter(rate=0)
@@ -0,0 +1,210 @@
+"""Unit tests for the API response schemas and parsers.
+
+Tests cover:
+- Parsing nested API responses into typed schema records
+- Collection ordering and period lookups
+- Handling of missing sections and malformed rows
+"""
+from dataclasses import FrozenInstanceError
+from datetime import date
+
+import pytest
+
+from src.schemas.balance_sheet import parse_balance_sheets
+from src.schemas.eod import parse_eod_prices
+from src.schemas.income_statement import parse_income_statements
+
+
+def _financials(statement, rows):
+    return {"fundamentals": {"financials": {statement: {"data": rows}}}}
+
+
+INCOME_ROWS = [
+    {"symbol": "AAPL", "period": "Q3", "date": "2024-09-30", "calendarYear": "2024",
+     "revenue": 90.0, "netIncome": 9.0, "eps": 1.5},
+    {"symbol": "AAPL", "period": "FY", "date": "2024-09-30", "calendarYear": "2024",
+     "revenue": 380.0, "netIncome": 40.0, "eps": 6.0},
+    {"symbol": "AAPL", "period": "Q4", "date": "2024-12-31", "calendarYear": "2024",
+     "revenue": 120.0, "netIncome": 12.0, "eps": 2.0},
+    {"symbol": "AAPL", "period": "Q2", "date": "2024-06-30", "calendarYear": "2024",
+     "revenue": 80.0, "netIncome": 8.0, "eps": 1.2},
+]
+
+
+class TestIncomeStatements:
+    """Tests for parse_income_statements and IncomeStatementCollection."""
+
+    def test_parses_and_sorts_newest_first(self):
+        collection = parse_income_statements(_financials("income_statement", INCOME_ROWS))
+
+        assert [i.period_end for i in collection.items][0] == date(2024, 12, 31)
+        latest = collection.latest_quarter()
+        assert latest.period == "Q4"
+        assert latest.calendar_year == 2024
+        assert latest.net_income == 12.0
+
+    def test_quarter_and_year_lookups(self):
+        collection = parse_income_statements(_financials("income_statement", INCOME_ROWS))
+
+        assert collection.previous_quarter().period == "Q3"
+        assert [q.period for q in collection.last_n_quarters(4)] == ["Q4", "Q3", "Q2"]
+        assert collection.latest_year().revenue == 380.0
+
+    def test_missing_section_returns_empty_collection(self):
+        collection = parse_income_statements({})
+
+        assert collection.items == []
+        assert collection.latest_quarter() is None
+        assert collection.previous_quarter() is None
+
+    def test_records_are_immutable(self):
+        item = parse_income_statements(_financials("income_statement", INCOME_ROWS)).items[0]
+
+        with pytest.raises(FrozenInstanceError):
+            item.revenue = 0.0
+
+
+class TestBalanceSheets:
+    """Tests for parse_balance_sheets and BalanceSheetCollection."""
+
+    def test_latest_year(self):
+        rows = [
+            {"symbol": "AAPL", "period": "FY", "date": "2023-09-30", "calendarYear": "2023",
+             "totalDebt": 10.0, "totalEquity": 20.0},
+            {"symbol": "AAPL", "period": "FY", "date": "2024-09-30", "calendarYear": "2024",
+             "totalDebt": 11.0, "totalEquity": 22.0, "totalAssets": 99.0},
+        ]
+
+        latest = parse_balance_sheets(_financials("balance_sheet_statement", rows)).latest_year()
+
+        assert latest.period_end == date(2024, 9, 30)
+        assert latest.total_debt == 11.0
+        assert latest.total_equity == 22.0
+
+    def test_periods_are_partitioned(self):
+        rows = [
+            {"symbol": "AAPL", "period": "Q1", "date": "2025-03-31", "calendarYear": "2025",
+             "totalDebt": 12.0, "totalEquity": 23.0},
+            {"symbol": "AAPL", "period": "FY", "date": "2024-12-31", "calendarYear": "2024",
+             "totalDebt": 11.0, "totalEquity": 22.0},
+            {"symbol": "AAPL", "period": "H1", "date": "2025-06-30", "calendarYear": "2025",
+             "totalDebt": 13.0, "totalEquity": 24.0},
+        ]
+
+        collection = parse_balance_sheets(_financials("balance_sheet_statement", rows))
+
+        assert collection.latest_year().period == "FY"
+        assert collection.latest_quarter().period == "Q1"
+
+
+class TestEODPrices:
+    """Tests for parse_eod_prices and EODPriceCollection."""
+
+    def test_latest_close(self):
+        response = {"stockprice": {"data": [
+            {"date": "2025-01-02", "close": 101.0},
+            {"date": "2025-01-03", "close": 103.5, "volume": 1000},
+        ]}}
+
+        collection = parse_eod_prices("AAPL", response)
+
+        assert collection.latest().date == date(2025, 1, 3)
+        assert collection.latest().symbol == "AAPL"
+        assert collection.latest_close() == 103.5
+
+    def test_missing_prices(self):
+        assert parse_eod_prices("AAPL", {}).latest_close() is None
+
+
+class TestCoercion:
+    """API values are coerced to the schema types, as pydantic used to do."""
+
+    def test_numeric_strings_become_floats(self):
+        rows = [{"symbol": "AAPL", "period": "Q1", "date": "2024-03-31", "calendarYear": "2024",
+                 "revenue": "90.5", "netIncome": "9", "eps": None}]
+
+        item = parse_income_statements(_financials("income_statement", rows)).items[0]
+
+        assert item.revenue == 90.5
+        assert item.net_income == 9.0
+        assert item.eps is None
+
+    def test_datetime_strings_become_dates(self):
+        rows = [{"symbol": "AAPL", "period": "FY", "date": "2024-06-30T00:00:00",
+                 "calendarYear": "2024", "totalDebt": "11", "totalEquity": 22}]
+
+        item = parse_balance_sheets(_financials("balance_sheet_statement", rows)).latest_year()
+
+        assert item.period_end == date(2024, 6, 30)
+        assert item.total_debt == 11.0
+
+    def test_eod_values_are_coerced(self):
+        response = {"stockprice": {"data": [{"date": "2025-01-03T00:00:00", "close": "103.5"}]}}
+
+        latest = parse_eod_prices("AAPL", response).latest()
+
+        assert latest.date == date(2025, 1, 3)
+        assert latest.close == 103.5
+
+
+class TestMalformedRows:
+    """Rows missing required fields are skipped rather than failing the parse."""
+
+    def test_income_rows_without_date_or_symbol_are_skipped(self, caplog):
+        rows = INCOME_ROWS + [
+            {"symbol": "AAPL", "period": "Q1", "calendarYear": "2024"},
+            {"period": "Q1", "date": "2024-03-31", "calendarYear": "2024"},
+        ]
+
+        collection = parse_income_statements(_financials("income_statement", rows))
+
+        assert len(collection.items) == len(INCOME_ROWS)
+        assert "Skipped 2 malformed income statement rows" in caplog.text
+
+    def test_balance_rows_without_period_are_skipped(self):
+        rows = [{"symbol": "AAPL", "date": "2024-09-30", "calendarYear": "2024"}]
+
+        assert parse_balance_sheets(_financials("balance_sheet_statement", rows)).items == []
+
+    def test_eod_rows_without_date_are_skipped(self):
+        response = {"stockprice": {"data": [{"close": 1.0}, {"date": "2025-01-02", "close": 2.0}]}}
+
+        assert parse_eod_prices("AAPL", response).latest_close() == 2.0
+
+    @pytest.mark.parametrize("bad_row", [
+        {"symbol": "AAPL", "period": "Q1", "date": "2024-03-31"},
+        {"symbol": "AAPL", "period": "Q1", "date": "31.03.2024", "calendarYear": "2024"},
+        {"symbol": "AAPL", "period": "Q1", "date": "2024-03-31", "calendarYear": "2024",
+         "revenue": "n/a"},
+        ["AAPL", "Q1", "2024-03-31"],
+        None,
+    ], ids=["missing-calendar-year", "non-iso-date", "non-numeric-value", "list-row", "null-row"])
+    def test_unparsable_income_rows_are_skipped(self, bad_row, caplog):
+        collection = parse_income_statements(_financials("income_statement", INCOME_ROWS + [bad_row]))
+
+        assert len(collection.items) == len(INCOME_ROWS)
+        assert "Skipped 1 malformed income statement rows" in caplog.text
+
+    def test_unparsable_balance_rows_are_skipped(self):
+        rows = [
+            {"symbol": "AAPL", "period": "FY", "date": "2024-09-30"},
+            {"symbol": "AAPL", "period": "FY", "date": "30.09.2024", "calendarYear": "2024"},
+            "not a row",
+            {"symbol": "AAPL", "period": "FY", "date": "2023-09-30", "calendarYear": "2023",
+             "totalDebt": 10.0, "totalEquity": 20.0},
+        ]
+
+        collection = parse_balance_sheets(_financials("balance_sheet_statement", rows))
+
+        assert [i.calendar_year for i in collection.items] == [2023]
+
+    def test_unparsable_eod_rows_are_skipped(self, caplog):
+        response = {"stockprice": {"data": [
+            {"date": "2025/01/03", "close": 3.0},
+            {"date": "2025-01-04", "close": "closed"},
+            42,
+            {"date": "2025-01-02", "close": 2.0},
+        ]}}
+
+        assert parse_eod_prices("AAPL", response).latest_close() == 2.0
+        assert "Skipped 3 malformed EOD price rows" in caplog.text
@@ -0,0 +1,90 @@
+"""Unit tests for TickerRepository."""
+import pytest
+from datetime import date
+
+from src.models.ticker_stats import TickerStats, TickerStatsRow
+from src.repositories.ticker_repo import TickerRepository
+
+
+@pytest.fixture
+def repo(db):
+    return TickerRepository(db)
+
+
+def make_ticker(symbol: str, period_end: date = date(2025, 3, 31), **metrics) -> TickerStats:
+    """Build a transient TickerStats row for `symbol`."""
+    return TickerStats(
+        symbol=symbol,
+        industry="Software - Application",
+        period_end=period_end,
+        **metrics,
+    )
+
+
+class TestBulkSave:
+    """Tests for TickerRepository.bulk_save."""
+
+    def test_bulk_save_inserts_all_rows(self, repo):
+        repo.bulk_save([
+            make_ticker("AAPL", pe_ratio=20.0, debt_ratio=0.5),
+            make_ticker("MSFT", revenue_growth_qoq=0.1, net_income_ttm=100.0),
+        ])
+
+        rows = {t.symbol: t for t in repo.get_all()}
+
+        assert set(rows) == {"AAPL", "MSFT"}
+        assert rows["AAPL"].pe_ratio == 20.0
+        assert rows["AAPL"].debt_ratio == 0.5
+        assert rows["AAPL"].revenue_growth_qoq is None
+        assert rows["MSFT"].net_income_ttm == 100.0
+        assert rows["MSFT"].period_end == date(2025, 3, 31)
+        assert rows["MSFT"].created_at is not None
+
+    def test_bulk_save_returns_generated_ids(self, repo):
+        """Primary keys are returned in input order without a second query."""
+        ids = repo.bulk_save([make_ticker("AAPL"), make_ticker("MSFT"), make_ticker("GOOGL")])
+
+        by_id = {t.id: t.symbol for t in repo.get_all()}
+
+        assert len(ids) == 3
+        assert [by_id[i] for i in ids] == ["AAPL", "MSFT", "GOOGL"]
+
+    def test_bulk_save_accepts_plain_rows(self, repo):
+        """Unmapped TickerStatsRow objects from the ETL are persisted as-is."""
+        repo.bulk_save([
+            TickerStatsRow(
+                symbol="AAPL",
+                industry="Consumer Electronics",
+                period_end=date(2025, 3, 31),
+                pe_ratio=25.0,
+            ),
+        ])
+
+        saved = repo.get_by_symbol("AAPL")
+
+        assert saved.industry == "Consumer Electronics"
+        assert saved.pe_ratio == 25.0
+        assert saved.debt_ratio is None
+
+    def test_bulk_save_empty_list(self, repo):
+        assert repo.bulk_save([]) == []
+        assert repo.get_all() == []
+
+
+class TestGetBySymbol:
+    """Tests for TickerRepository.get_by_symbol."""
+
+    def test_returns_latest_period(self, repo):
+        repo.bulk_save([
+            make_ticker("AAPL", period_end=date(2024, 12, 31), pe_ratio=18.0),
+            make_ticker("AAPL", period_end=date(2025, 3, 31), pe_ratio=20.0),
+            make_ticker("AAPL", period_end=date(2024, 9, 30), pe_ratio=16.0),
+        ])
+
+        latest = repo.get_by_symbol("AAPL")
+
+        assert latest.period_end == date(2025, 3, 31)
+        assert latest.pe_ratio == 20.0
+
+    def test_missing_symbol(self, repo):
+        assert repo.get_by_symbol("MISSING") is None
@@ -0,0 +1,69 @@
+"""Unit tests for shared helpers in src.core.utils."""
+from datetime import date
+
+import pytest
+
+from src.core.utils import dig, parse_date, to_float
+
+
+DATA = {"a": {"b": [{"c": 1}]}}
+
+
+class TestDig:
+    """Tests for dig."""
+
+    def test_returns_nested_value(self):
+        assert dig(DATA, "a", "b", 0, "c") == 1
+
+    def test_no_keys_returns_data(self):
+        assert dig(DATA) is DATA
+
+    @pytest.mark.parametrize("keys", [
+        ("missing",),
+        ("a", "b", 1),
+        ("a", "b", "c"),
+        ("a", "b", 0, "c", "d"),
+    ])
+    def test_missing_path_returns_default(self, keys):
+        assert dig(DATA, *keys) is None
+        assert dig(DATA, *keys, default=[]) == []
+
+    def test_none_input(self):
+        assert dig(None, "a", default=0) == 0
+
+
+class TestToFloat:
+    """Tests for to_float."""
+
+    @pytest.mark.parametrize("value, expected", [
+        (None, None),
+        (12, 12.0),
+        (12.5, 12.5),
+        ("12.5", 12.5),
+        ("-3", -3.0),
+    ])
+    def test_coerces_numbers(self, value, expected):
+        assert to_float(value) == expected
+
+    @pytest.mark.parametrize("value", ["n/a", "", [1]])
+    def test_rejects_non_numbers(self, value):
+        with pytest.raises((ValueError, TypeError)):
+            to_float(value)
+
+
+class TestParseDate:
+    """Tests for parse_date."""
+
+    @pytest.mark.parametrize("value", [
+        "2024-06-30",
+        "2024-06-30T00:00:00",
+        "2024-06-30 12:30:00+00:00",
+        date(2024, 6, 30),
+    ])
+    def test_parses_dates_and_datetimes(self, value):
+        assert parse_date(value) == date(2024, 6, 30)
+
+    @pytest.mark.parametrize("value", ["30.06.2024", "", None])
+    def test_rejects_invalid_dates(self, value):
+        with pytest.raises((ValueError, TypeError)):
+            parse_date(value)